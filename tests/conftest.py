@@ -0,0 +1,203 @@
+"""
+Shared Test Fixtures
+~~~~~~~~~~~~~~~~~~~~
+
+Fixtures shared by the vesting manager and executor test modules.
+Each test module declares its own autouse isolation fixture.
+The executor is deployed, configured, funded and approved once per session
+and a chain snapshot is taken; `module_isolation` and `fn_isolation` are
+overridden here to revert to that baseline instead of resetting the fork.
+The suite can run in parallel with `brownie test -n auto`; brownie offsets
+the development network port by xdist worker id, so every worker forks its
+own chain and deploys its own executor through the `main` fixture.
+
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from brownie import accounts, chain, Contract
+from brownie import VestingExecutor
+
+MAX_UINT = 2**256 - 1
+
+# Pinned ABI for the mainnet tokens, so the suite never fetches one from Etherscan.
+# Not persisted: the fork shares mainnet's chain id, so a saved copy would shadow
+# the full ABI for these addresses outside the tests
+ERC20_ABI = json.loads((Path(__file__).parent / "abis" / "erc20.json").read_text())
+
+####################################################################################
+##### ----- Fixtures   ----- #####
+####################################################################################
+
+
+@pytest.fixture(scope="session")
+def main():
+    vesting_executor = VestingExecutor.deploy({"from": accounts[1]})
+    yield vesting_executor
+
+
+@pytest.fixture(scope="session")
+def vesting_manager(main):
+    vesting_executor = main
+    vesting_manager_address = main.vestingManager()
+    return vesting_manager_address
+
+
+@pytest.fixture(scope="session")
+def tokenlock(main):
+    vesting_executor = main
+    token_lock_address = main.tokenLock()
+    return token_lock_address
+
+
+@pytest.fixture(scope="session")
+def eefi_contract():
+    return Contract.from_abi(
+        "EEFI", "0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3", ERC20_ABI, persist=False
+    )
+
+
+@pytest.fixture(scope="session")
+def dai_contract():
+    return Contract.from_abi(
+        "DAI", "0x6B175474E89094C44Da98b954EedeAC495271d0F", ERC20_ABI, persist=False
+    )
+
+
+@pytest.fixture(scope="session")
+def usdc_contract():
+    return Contract.from_abi(
+        "USDC", "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48", ERC20_ABI, persist=False
+    )
+
+
+@pytest.fixture(scope="session")
+def usdt_contract():
+    return Contract.from_abi(
+        "USDT", "0xdAC17F958D2ee523a2206206994597C13D831ec7", ERC20_ABI, persist=False
+    )
+
+
+@pytest.fixture(scope="session")
+def lusd_contract():
+    return Contract.from_abi(
+        "LUSD", "0x5f98805A4E8be255a32880FDeC7F6728C6568bA0", ERC20_ABI, persist=False
+    )
+
+
+@pytest.fixture(scope="session")
+def eefi_whale():
+    return accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
+
+
+@pytest.fixture(scope="session")
+def dai_whale():
+    return accounts.at("0x748dE14197922c4Ae258c7939C7739f3ff1db573", force=True)
+
+
+@pytest.fixture(scope="session")
+def usdc_whale():
+    return accounts.at("0x7B299ff0Bf1531C095bBE63bCF79af31eEA418Da", force=True)
+
+
+@pytest.fixture(scope="session")
+def usdt_whale():
+    return accounts.at("0x23eBA962AC256e4BDfEb926c438AD33f96a68042", force=True)
+
+
+@pytest.fixture(scope="session")
+def lusd_whale():
+    return accounts.at("0x833642ED556a8a41D5fd5729D9fED774A039f13c", force=True)
+
+
+@pytest.fixture(scope="session")
+def transfer_amount():
+    # EEFI seeded into the vesting manager and token lock
+    return 5000 * 10**18
+
+
+@pytest.fixture(scope="session")
+def funded_manager(vesting_manager, eefi_contract, eefi_whale, transfer_amount):
+    # Seed the vesting manager once per session, ahead of the baseline snapshot
+    eefi_contract.transfer(vesting_manager, transfer_amount, {"from": eefi_whale})
+
+    return vesting_manager
+
+
+@pytest.fixture(scope="session")
+def funded_tokenlock(tokenlock, eefi_contract, eefi_whale, transfer_amount):
+    # Seed the token lock once per session for the locked token withdrawal tests
+    eefi_contract.transfer(tokenlock, transfer_amount, {"from": eefi_whale})
+
+    return tokenlock
+
+
+@pytest.fixture(scope="session")
+def approvals(
+    main,
+    eefi_contract,
+    dai_contract,
+    usdc_contract,
+    usdt_contract,
+    lusd_contract,
+    eefi_whale,
+    dai_whale,
+    usdc_whale,
+    usdt_whale,
+    lusd_whale,
+):
+    # Grant the executor a max allowance from each whale once per session; a fixed
+    # gas limit skips the estimateGas round trip on these known-good calls. USDT
+    # only accepts a new allowance from zero, which holds for a fresh executor
+    for token, whale in (
+        (eefi_contract, eefi_whale),
+        (dai_contract, dai_whale),
+        (usdc_contract, usdc_whale),
+        (usdt_contract, usdt_whale),
+        (lusd_contract, lusd_whale),
+    ):
+        token.approve(main, MAX_UINT, {"from": whale, "gas_limit": 100000})
+
+    return main
+
+
+@pytest.fixture(scope="session")
+def verbose(request):
+    # Diagnostics that decode transaction reports or make extra RPC reads; only
+    # run them under -vv
+    if request.config.getoption("verbose") > 1:
+        return lambda report: report()
+    return lambda report: None
+
+
+@pytest.fixture(scope="session")
+def configured_executor(main):
+    # Purchase threshold and release percentage shared by the purchase tests;
+    # tests needing a different release percentage set their own
+    purchase_amount_threshold = 3000
+    release_percentage = 2 * 10**4
+
+    main.setPurchaseAmountThreshold(purchase_amount_threshold, {"from": accounts[1]})
+    main.setReleasePercentage(release_percentage, {"from": accounts[1]})
+
+    return main
+
+
+@pytest.fixture(scope="session")
+def baseline(configured_executor, funded_manager, funded_tokenlock, approvals):
+    # Brownie keeps a single snapshot; isolation fixtures revert back to this one
+    chain.snapshot()
+
+
+@pytest.fixture(scope="module")
+def module_isolation(baseline):
+    yield
+    chain.revert()
+
+
+@pytest.fixture(scope="function")
+def fn_isolation(baseline):
+    yield
+    chain.revert()
@@ -0,0 +1,290 @@
+"""
+Vesting Executor Parameter Test Suite
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Unit tests for vesting executor settings, statuses and whitelist management.
+Tests in this module only set parameters or read state, so blockchain state
+resets once per module instead of after each test.
+Utilizes brownie and pytest.
+
+"""
+
+import pytest
+import brownie
+from brownie import accounts
+
+####################################################################################
+##### ----- Fixtures   ----- #####
+####################################################################################
+
+
+@pytest.fixture(scope="module", autouse=True)
+def isolation(module_isolation):
+    pass
+
+
+####################################################################################
+##### ----- Tests   ----- #####
+####################################################################################
+
+##### ----- Asset Deposits  ----- #####
+
+# Contract does not accept ETH deposits
+def test_transfer_eth_into_vesting_manager_contract(vesting_manager, capsys):
+    # Contract does not accept ETH, so it should fail
+
+    vesting_manager_address = vesting_manager
+
+    with brownie.reverts():
+        transfer_ETH_into_contract = accounts[0].transfer(
+            vesting_manager_address, "1 ether", gas_limit=500000, allow_revert=True
+        )
+
+    with capsys.disabled():
+        print("Contract does not accept ETH, so it should fail")
+
+##### ----- Contract Deployment and Parameters Setting  ----- #####
+
+# Ensure valid vesting parameters are set
+def test_valid_vesting_parameters_setting(main, capsys):
+    vesting_executor = main
+
+    purchase_cliff_weeks = 52  # 1 year
+    purchase_vesting_weeks = 55  # Vesting occurs over 3 weeks post-cliff
+    swap_cliff_weeks = 52
+    swap_vesting_weeks = 55
+
+    vesting_executor = main
+
+    vesting_executor.setValidVestingParams(
+        purchase_cliff_weeks,
+        purchase_vesting_weeks,
+        swap_cliff_weeks,
+        swap_vesting_weeks,
+        {"from": accounts[1]},
+    )
+
+    with capsys.disabled():
+        print(vesting_executor.validVestingParams())
+
+
+# # Ensure token lock contract is deployed properly
+def test_address_of_token_lock_contract(vesting_manager, main, capsys):
+    vesting_executor = main
+
+    token_lock_address = vesting_executor.tokenLock()
+
+    assert token_lock_address != main, "token lock contract not deployed"
+
+    with capsys.disabled():
+        print("Token lock address should be different from executor")
+
+
+# ##### ----- Contract Status: Vesting, Whitelist  ----- #####
+
+# Vesting status is pausable
+def test_reset_vesting_status(main, capsys):
+    ## Test Setup ##
+
+    vesting_executor = main
+
+    ## Test Actions ##
+
+    testing_status = 1  # Inactive
+
+    vesting_executor.setVestingStatus(
+        testing_status, {"from": accounts[1]}
+    )  # Set status
+
+    vesting_status = vesting_executor.current_vesting_status()  # Check status
+
+    assert vesting_status == 1, "vesting status not updated"
+
+    with capsys.disabled():
+        print("Vesting status should be 1 (inactive)")
+        print(vesting_status)
+
+
+# Whitelist status is pausable
+def test_reset_whitelist_status(main, capsys):
+    ## Test Setup ##
+
+    vesting_executor = main
+
+    ## Test Actions ##
+
+    whitelist_status = 0  # Active
+
+    vesting_executor.setWhiteListStatus(
+        whitelist_status, {"from": accounts[1]}
+    )  # Set status
+
+    whitelist_status = vesting_executor.current_whitelist_status()  # Check status
+
+    assert whitelist_status == 0, "whitelist status not updated"
+
+    with capsys.disabled():
+        print("Vesting status should be 0 (active)")
+        print(whitelist_status)
+
+
+# ##### ----- Adding/Removing Addresses from Whitelist ----- #####
+
+
+def test_add_users_to_whitelist(main, capsys):
+    ## Test Setup ##
+
+    vesting_executor = main
+
+    ## Test Actions ##
+
+    whitelist_addresses = [
+        "0x4675C7e5BaAFBFFbca748158bEcBA61ef3b0a263",
+        "0x25994D723594A225E62DACc72c50AD6EFE75Ff9D",
+        "0x25994D723594A225E62DACc72c50AD6EFE75Ff9D",
+    ]
+
+    vesting_executor.addAuthorizedSwapAddresses(
+        whitelist_addresses, {"from": accounts[1]}
+    )  # Add addresses
+
+    whitelist_address_check = vesting_executor.isWhitelisted(
+        whitelist_addresses[0]
+    )  # Check address
+
+    assert whitelist_address_check == True
+
+    with capsys.disabled():
+        print("Address check should return True")
+        print(whitelist_address_check)
+
+
+def test_remove_user_from_whitelist(main, capsys):
+    ## Test Setup ##
+
+    vesting_executor = main
+
+    whitelist_addresses = [
+        "0x4675C7e5BaAFBFFbca748158bEcBA61ef3b0a263",
+        "0x25994D723594A225E62DACc72c50AD6EFE75Ff9D",
+        "0x25994D723594A225E62DACc72c50AD6EFE75Ff9D",
+    ]
+
+    vesting_executor.addAuthorizedSwapAddresses(
+        whitelist_addresses, {"from": accounts[1]}
+    )  # Add addresses
+
+    ## Test Actions ##
+
+    vesting_executor.removeAuthorizedSwapAddress(
+        whitelist_addresses[1], {"from": accounts[1]}
+    )  # Remove Address
+
+    whitelist_address_check = vesting_executor.isWhitelisted(
+        whitelist_addresses[1]
+    )  # Check address
+
+    assert whitelist_address_check == False
+
+    with capsys.disabled():
+        print("Address check should return False")
+        print(whitelist_address_check)
+
+
+# ##### ----- Thresholds, Ratios and Asset Pricing ----- #####
+
+# # Purchase amount threshold to trigger immediate release of portion of vesting tokens
+def test_set_purchase_amount_threshold(main, capsys):
+    ## Test Setup ##
+
+    vesting_executor = main
+
+    ## Test Actions ##
+
+    purchase_amount_threshold = 5000
+
+    vesting_executor.setPurchaseAmountThreshold(
+        purchase_amount_threshold, {"from": accounts[1]}
+    )  # Set threshold
+
+    purchase_amount_threshold_contract = (
+        vesting_executor.purchaseAmountThreshold()
+    )  # Check threshold
+
+    assert purchase_amount_threshold == purchase_amount_threshold_contract
+
+    with capsys.disabled():
+        print("Purchase amount threshold should be 3500")
+        print(purchase_amount_threshold_contract)
+
+
+# # Percentage of vesting tokens to be released
+def test_setting_release_percentage(main, capsys):
+    ## Test Setup ##
+
+    vesting_executor = main
+    ## Test Actions ##
+
+    release_percentage = 2 * 10**4
+
+    vesting_executor.setReleasePercentage(
+        release_percentage, {"from": accounts[1]}
+    )  # Set percentage
+
+    release_percentage_threshold_contract = (
+        vesting_executor.releasePercentage()
+    )  # Check percentage
+
+    assert (
+        release_percentage == release_percentage_threshold_contract
+    ), "release percentage not set"
+
+    with capsys.disabled():
+        print("Release percentage should be 2*10**4")
+        print(release_percentage_threshold_contract)
+
+
+def test_setting_release_percentage_not_scaled(main, capsys):
+    ## Test Setup ##
+
+    vesting_executor = main
+    ## Test Actions ##
+
+    release_percentage = 2
+
+    with brownie.reverts("Release percentage must be scaled to 10 ** 4"):
+        release_percentage_setting = vesting_executor.setReleasePercentage(
+            release_percentage,
+            {"from": accounts[1], "gas_limit": 500000, "allow_revert": True},
+        )  # Set percentage
+
+    with capsys.disabled():
+        print("Release percentage should fail because the number is not scaled")
+
+
+def test_vesting_token_price_not_scaled(main, eefi_contract, capsys):
+    ## Test Setup ##
+
+    vesting_executor = main
+    ## Test Actions ##
+
+    vesting_executor = main
+
+    vesting_token_price = 12
+
+    eefi_token_address = eefi_contract.address
+
+    eefi_token_decimals = 10**18
+
+    eefi_token_decimal_number = 18
+
+    with brownie.reverts("Price must be scaled to 10 ** 4"):
+        set_vesting_token = vesting_executor.addVestingToken(
+            eefi_token_address,
+            eefi_token_decimals,
+            vesting_token_price,
+            eefi_token_decimal_number,
+        )
+
+    with capsys.disabled():
+        print("Setting vesting token should fail because price is not scaled")
@@ -10,70 +10,59 @@ Utilizes brownie and pytest.
 """
 
 import pytest
-import json
 import brownie
-from brownie import accounts, Contract, network
-from brownie import VestingExecutor, VestingManager
-from web3 import Web3
-from brownie.test import given, strategy
-import time
-import math
+from brownie import accounts, multicall
+
+DEFAULT_CLIFF_WEEKS = 52  # 1 year
+DEFAULT_VESTING_WEEKS = 55  # Vesting occurs over 3 weeks post-cliff
+SECONDS_PER_DAY = 86400
+# Multicall3 is already deployed on mainnet; passing it stops brownie deploying Multicall2
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
 
 ####################################################################################
 ##### ----- Fixtures   ----- #####
 ####################################################################################
 
 
-@pytest.fixture(scope="module")
-def main():
-    vesting_executor = VestingExecutor.deploy({"from": accounts[1]})
-    yield vesting_executor
-
-
-@pytest.fixture(scope="module")
-def vesting_manager(main):
-    vesting_executor = main
-    vesting_manager_address = main.vestingManager()
-    return vesting_manager_address
+@pytest.fixture(scope="function")
+def make_vesting_parameters(eefi_contract, chain):
+    # Build an EEFI vesting params list; start_offset moves the start time back
+    def make(
+        cliff_weeks=DEFAULT_CLIFF_WEEKS,
+        vesting_weeks=DEFAULT_VESTING_WEEKS,
+        is_fixed=False,
+        start_offset=0,
+    ):
+        asset_address = eefi_contract.address
+        start_time = chain.time() - start_offset  # Current time in UNIX
+
+        vesting_params_list = [
+            asset_address,
+            is_fixed,
+            cliff_weeks,
+            vesting_weeks,
+            start_time,
+        ]
+
+        return vesting_params_list
+
+    return make
 
-@pytest.fixture(scope="module")
-def tokenlock(main):
-    vesting_executor = main
-    token_lock_address = main.tokenLock()
-    return token_lock_address 
 
 @pytest.fixture(scope="function")
-def standard_vesting_parameters():
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    asset_address = eefi_contract.address
-    is_fixed = False
-    cliff_weeks = 52  # 1 year
-    vesting_weeks = 55  # Vesting occurs over 3 weeks post-cliff
-    start_time = current_time = time.time()  # Current time in UNIX
-
-    vesting_params_list = [
-        asset_address,
-        is_fixed,
-        cliff_weeks,
-        vesting_weeks,
-        start_time,
-    ]
-
-    return vesting_params_list
+def standard_vesting_parameters(make_vesting_parameters):
+    return make_vesting_parameters()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="function")
 def valid_vesting_parameters(main):
     vesting_executor = main
 
-    purchase_cliff_weeks = 52  # 1 year
-    purchase_vesting_weeks = 55  # Vesting occurs over 3 weeks post-cliff
+    purchase_cliff_weeks = DEFAULT_CLIFF_WEEKS
+    purchase_vesting_weeks = DEFAULT_VESTING_WEEKS
     swap_cliff_weeks = 52
     swap_vesting_weeks = 88
 
-    vesting_executor = main
-
     vesting_executor.setValidVestingParams(
         purchase_cliff_weeks,
         purchase_vesting_weeks,
@@ -84,11 +73,9 @@ def valid_vesting_parameters(main):
 
 
 @pytest.fixture(scope="function")
-def set_vesting_token(main):
+def set_vesting_token(main, eefi_contract):
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
     vesting_token_price = 12 * 10**4
 
     eefi_token_address = eefi_contract.address
@@ -107,6 +94,18 @@ def set_vesting_token(main):
     return set_vesting_token
 
 
+@pytest.fixture(scope="function")
+def stable(request, dai_contract, usdc_contract, dai_whale, usdc_whale):
+    # Stablecoin used for the purchase: (contract, whale, decimals, release
+    # percentage scaled to 10^4)
+    stables = {
+        "dai": (dai_contract, dai_whale, 10**18, 2 * 10**4),
+        "usdc": (usdc_contract, usdc_whale, 10**6, 25 * 10**3),
+    }
+
+    return stables[request.param]
+
+
 @pytest.fixture(autouse=True)
 def isolation(fn_isolation):
     pass
@@ -118,42 +117,16 @@ def isolation(fn_isolation):
 
 ##### ----- Asset Deposits, Balances and withdrawals  ----- #####
 
-# Contract does not accept ETH deposits
-def test_transfer_eth_into_vesting_manager_contract(vesting_manager, capsys):
-    # Contract does not accept ETH, so it should fail
-
-    vesting_manager_address = vesting_manager
-
-    with brownie.reverts():
-        transfer_ETH_into_contract = accounts[0].transfer(
-            vesting_manager_address, "1 ether"
-        )
-
-    with capsys.disabled():
-        print("Contract does not accept ETH, so it should fail")
-
 #Test token withdrawal from token lock contract 
-def test_token_lock_contract_withdrawal(tokenlock, main, capsys):
+def test_token_lock_contract_withdrawal(
+    funded_tokenlock, main, eefi_contract, transfer_amount, verbose, capsys
+):
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    token_lock_address = tokenlock
-
-    eefi_approval = 500000 * 10**18
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        token_lock_address, transfer_amount, {"from": eefi_whale}
-    )
+    token_lock_address = funded_tokenlock
 
     contract_eefi_balance = eefi_contract.balanceOf(token_lock_address)
 
-    transfer_amount = 5000 * 10**18
-
     assert (
         contract_eefi_balance == transfer_amount
     ), "tokens not successfully transfered"
@@ -168,54 +141,20 @@ def test_token_lock_contract_withdrawal(tokenlock, main, capsys):
 
     with capsys.disabled():
         print("Account balance should be 5000 EEFI")
-        print(withdraw_eefi_balance.info())
+        verbose(withdraw_eefi_balance.info)
 
 ##### ----- Contract Deployment and Parameters Setting  ----- #####
 
-# Ensure valid vesting parameters are set
-def test_valid_vesting_parameters_setting(main, capsys):
-    vesting_executor = main
-
-    purchase_cliff_weeks = 52  # 1 year
-    purchase_vesting_weeks = 55  # Vesting occurs over 3 weeks post-cliff
-    swap_cliff_weeks = 52
-    swap_vesting_weeks = 55
-
-    vesting_executor = main
-
-    vesting_executor.setValidVestingParams(
-        purchase_cliff_weeks,
-        purchase_vesting_weeks,
-        swap_cliff_weeks,
-        swap_vesting_weeks,
-        {"from": accounts[1]},
-    )
-
-    with capsys.disabled():
-        print(vesting_executor.validVestingParams())
-
 # # Ensure Vesting Manger contract is deployed properly can can accept vesting asset
-def test_check_balance_of_vesting_manager_eefi(vesting_manager, main, capsys):
+def test_check_balance_of_vesting_manager_eefi(
+    funded_manager, main, eefi_contract, transfer_amount, capsys
+):
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    vesting_manager_address = vesting_manager
-
-    eefi_approval = 500000 * 10**18
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
+    vesting_manager_address = funded_manager
 
     contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
 
-    transfer_amount = 5000 * 10**18
-
     assert (
         contract_eefi_balance == transfer_amount
     ), "tokens not successfully transfered"
@@ -225,255 +164,16 @@ def test_check_balance_of_vesting_manager_eefi(vesting_manager, main, capsys):
         print(contract_eefi_balance)
 
 
-# # Ensure token lock contract is deployed properly
-def test_address_of_token_lock_contract(vesting_manager, main, capsys):
-    vesting_executor = main
-
-    token_lock_address = vesting_executor.tokenLock()
-
-    assert token_lock_address != main, "token lock contract not deployed"
-
-    with capsys.disabled():
-        print("Token lock address should be different from executor")
-
-
-# ##### ----- Contract Status: Vesting, Whitelist  ----- #####
-
-# Vesting status is pausable
-def test_reset_vesting_status(main, capsys):
-    ## Test Setup ##
-
-    vesting_executor = main
-
-    ## Test Actions ##
-
-    testing_status = 1  # Inactive
-
-    vesting_executor.setVestingStatus(
-        testing_status, {"from": accounts[1]}
-    )  # Set status
-
-    vesting_status = vesting_executor.current_vesting_status()  # Check status
-
-    assert vesting_status == 1, "vesting status not updated"
-
-    with capsys.disabled():
-        print("Vesting status should be 1 (inactive)")
-        print(vesting_status)
-
-
-# Whitelist status is pausable
-def test_reset_whitelist_status(main, capsys):
-    ## Test Setup ##
-
-    vesting_executor = main
-
-    ## Test Actions ##
-
-    whitelist_status = 0  # Active
-
-    vesting_executor.setWhiteListStatus(
-        whitelist_status, {"from": accounts[1]}
-    )  # Set status
-
-    whitelist_status = vesting_executor.current_whitelist_status()  # Check status
-
-    assert whitelist_status == 0, "whitelist status not updated"
-
-    with capsys.disabled():
-        print("Vesting status should be 0 (active)")
-        print(whitelist_status)
-
-
-# ##### ----- Adding/Removing Addresses from Whitelist ----- #####
-
-
-def test_add_users_to_whitelist(main, capsys):
-    ## Test Setup ##
-
-    vesting_executor = main
-
-    ## Test Actions ##
-
-    whitelist_addresses = [
-        "0x4675C7e5BaAFBFFbca748158bEcBA61ef3b0a263",
-        "0x25994D723594A225E62DACc72c50AD6EFE75Ff9D",
-        "0x25994D723594A225E62DACc72c50AD6EFE75Ff9D",
-    ]
-
-    vesting_executor.addAuthorizedSwapAddresses(
-        whitelist_addresses, {"from": accounts[1]}
-    )  # Add addresses
-
-    whitelist_address_check = vesting_executor.isWhitelisted(
-        whitelist_addresses[0]
-    )  # Check address
-
-    assert whitelist_address_check == True
-
-    with capsys.disabled():
-        print("Address check should return True")
-        print(whitelist_address_check)
-
-
-def test_remove_user_from_whitelist(main, capsys):
-    ## Test Setup ##
-
-    vesting_executor = main
-
-    whitelist_addresses = [
-        "0x4675C7e5BaAFBFFbca748158bEcBA61ef3b0a263",
-        "0x25994D723594A225E62DACc72c50AD6EFE75Ff9D",
-        "0x25994D723594A225E62DACc72c50AD6EFE75Ff9D",
-    ]
-
-    vesting_executor.addAuthorizedSwapAddresses(
-        whitelist_addresses, {"from": accounts[1]}
-    )  # Add addresses
-
-    ## Test Actions ##
-
-    vesting_executor.removeAuthorizedSwapAddress(
-        whitelist_addresses[1], {"from": accounts[1]}
-    )  # Remove Address
-
-    whitelist_address_check = vesting_executor.isWhitelisted(
-        whitelist_addresses[1]
-    )  # Check address
-
-    assert whitelist_address_check == False
-
-    with capsys.disabled():
-        print("Address check should return False")
-        print(whitelist_address_check)
-
-
-# ##### ----- Thresholds, Ratios and Asset Pricing ----- #####
-
-# # Purchase amount threshold to trigger immediate release of portion of vesting tokens
-def test_set_purchase_amount_threshold(main, capsys):
-    ## Test Setup ##
-
-    vesting_executor = main
-
-    ## Test Actions ##
-
-    purchase_amount_threshold = 5000
-
-    vesting_executor.setPurchaseAmountThreshold(
-        purchase_amount_threshold, {"from": accounts[1]}
-    )  # Set threshold
-
-    purchase_amount_threshold_contract = (
-        vesting_executor.purchaseAmountThreshold()
-    )  # Check threshold
-
-    assert purchase_amount_threshold == purchase_amount_threshold_contract
-
-    with capsys.disabled():
-        print("Purchase amount threshold should be 3500")
-        print(purchase_amount_threshold_contract)
-
-
-# # Percentage of vesting tokens to be released
-def test_setting_release_percentage(main, capsys):
-    ## Test Setup ##
-
-    vesting_executor = main
-    ## Test Actions ##
-
-    release_percentage = 2 * 10**4
-
-    vesting_executor.setReleasePercentage(
-        release_percentage, {"from": accounts[1]}
-    )  # Set percentage
-
-    release_percentage_threshold_contract = (
-        vesting_executor.releasePercentage()
-    )  # Check percentage
-
-    assert (
-        release_percentage == release_percentage_threshold_contract
-    ), "release percentage not set"
-
-    with capsys.disabled():
-        print("Release percentage should be 2*10**4")
-        print(release_percentage_threshold_contract)
-
-
-def test_setting_release_percentage_not_scaled(main, capsys):
-    ## Test Setup ##
-
-    vesting_executor = main
-    ## Test Actions ##
-
-    release_percentage = 2
-
-    with brownie.reverts("Release percentage must be scaled to 10 ** 4"):
-        release_percentage_setting = vesting_executor.setReleasePercentage(
-            release_percentage, {"from": accounts[1]}
-        )  # Set percentage
-
-    with capsys.disabled():
-        print("Release percentage should fail because the number is not scaled")
-
-
-def test_vesting_token_price_not_scaled(main, capsys):
-    ## Test Setup ##
-
-    vesting_executor = main
-    ## Test Actions ##
-
-    vesting_executor = main
-
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_token_price = 12
-
-    eefi_token_address = eefi_contract.address
-
-    eefi_token_decimals = 10**18
-
-    eefi_token_decimal_number = 18
-
-    with brownie.reverts("Price must be scaled to 10 ** 4"):
-        set_vesting_token = vesting_executor.addVestingToken(
-            eefi_token_address,
-            eefi_token_decimals,
-            vesting_token_price,
-            eefi_token_decimal_number,
-        )
-
-    with capsys.disabled():
-        print("Setting vesting token should fail because price is not scaled")
-
-
 # ##### ----- Vesting Asset Withdrawal  ----- #####
 
 # # Withdraw unlocked, vested assets from contract (multisig only)
-def test_vesting_token_withdrawal(vesting_manager, main, capsys):
+def test_vesting_token_withdrawal(
+    funded_manager, main, eefi_contract, eefi_whale, capsys
+):
     # # Contracts #
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     withdraw_amount = 200 * 10**18
 
     ## Test Actions ##
@@ -494,36 +194,22 @@ def test_vesting_token_withdrawal(vesting_manager, main, capsys):
 # ##### ----- Access Control ----- #####
 
 # # Non-multisig address can't withdraw unlocked vested assets
-def test_vesting_token_withdrawal_no_multisig(vesting_manager, main, capsys):
+def test_vesting_token_withdrawal_no_multisig(
+    funded_manager, main, eefi_contract, capsys
+):
     # # Contracts #
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     withdraw_amount = 200 * 10**18
 
     ## Test Actions ##
 
     with brownie.reverts():
         withdrawal_tx = vesting_executor.withdrawVestingTokens(
-            withdraw_amount, eefi_contract.address, {"from": accounts[1]}
+            withdraw_amount,
+            eefi_contract.address,
+            {"from": accounts[1], "gas_limit": 500000, "allow_revert": True},
         )
 
     with capsys.disabled():
@@ -531,46 +217,18 @@ def test_vesting_token_withdrawal_no_multisig(vesting_manager, main, capsys):
 
 
 # # Non-multisig address can't cancel individual vesting schedule
-def test_vesting_cancellation_not_multisig(vesting_manager, main, capsys, chain):
+def test_vesting_cancellation_not_multisig(
+    standard_vesting_parameters, funded_manager, main, eefi_contract, capsys, chain
+):
     # ## Test Setup ##
 
     # Contracts #
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
-    asset_address = eefi_contract.address
-    is_fixed = False
-    cliff_weeks = 52  # 1 year
-    vesting_weeks = 55  # Vesting occurs over 3 weeks post-cliff
-    start_time = time.time()  # Current time in UNIX
-
-    vesting_params_list = [
-        asset_address,
-        is_fixed,
-        cliff_weeks,
-        vesting_weeks,
-        start_time,
-    ]
+    vesting_params_list = standard_vesting_parameters
 
     # Vest Tokens ##
 
@@ -587,13 +245,10 @@ def test_vesting_cancellation_not_multisig(vesting_manager, main, capsys, chain)
 
     ## Move Chain Forward ##
 
-    unix_seconds_in_a_day = 86399
     days = 95
-    unix_time_elapsed = int(unix_seconds_in_a_day * days)
-
-    unix_time_at_end_of_vesting = int(start_time + unix_time_elapsed)
 
-    chain.mine(1, unix_time_at_end_of_vesting)
+    chain.sleep(SECONDS_PER_DAY * days)
+    chain.mine()
 
     ## Test Actions ##
 
@@ -604,7 +259,9 @@ def test_vesting_cancellation_not_multisig(vesting_manager, main, capsys, chain)
     with brownie.reverts():
         cancel_vesting_for_user = (
             vesting_executor.cancelVesting(
-                vestor_address, account_vesting_number, {"from": accounts[1]}
+                vestor_address,
+                account_vesting_number,
+                {"from": accounts[1], "gas_limit": 500000, "allow_revert": True},
             ),
             "If failed, multisig modifier did not work",
         )
@@ -614,7 +271,16 @@ def test_vesting_cancellation_not_multisig(vesting_manager, main, capsys, chain)
 
 # #Non-vesting address can't claim tokens
 def test_vesting_claim_not_vestor(
-    set_vesting_token, vesting_manager, main, capsys, chain
+    set_vesting_token,
+    make_vesting_parameters,
+    approvals,
+    funded_manager,
+    main,
+    eefi_contract,
+    dai_contract,
+    dai_whale,
+    capsys,
+    chain,
 ):
     # ## Test Setup ##
 
@@ -622,25 +288,9 @@ def test_vesting_claim_not_vestor(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    dai_contract = Contract("0x6B175474E89094C44Da98b954EedeAC495271d0F")
-
     dai_token_address = dai_contract.address
 
-    dai_whale = accounts.at("0x748dE14197922c4Ae258c7939C7739f3ff1db573", force=True)
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Set Threshold and Release Percentage #
-
-    purchase_amount_threshold = 3000
-
-    vesting_executor.setPurchaseAmountThreshold(
-        purchase_amount_threshold, {"from": accounts[1]}
-    )  # Set threshold
+    # Set Release Percentage #
 
     release_percentage = 2.5 * 10**4
 
@@ -652,24 +302,10 @@ def test_vesting_claim_not_vestor(
 
     vesting_token_price = 12
 
-    dai_approval = 500000 * 10**18
-
     desired_eefi_amount = 300
 
     purchase_amount = (desired_eefi_amount * vesting_token_price) * 10**18
 
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set Vesting Token
 
     eefi_token_address = eefi_contract.address
@@ -680,26 +316,11 @@ def test_vesting_claim_not_vestor(
 
     # Set up Vesting Parameters #
 
-    asset_address = eefi_contract.address
-    is_fixed = False  # Vesting can be cancelled
-    cliff_weeks = 52  # 1 year
-    vesting_weeks = 88  # Vesting occurs over 3 weeks post-cliff
-    start_time = current_time = time.time()  # Current time in UNIX
-
-    vesting_params_list = [
-        asset_address,
-        is_fixed,
-        cliff_weeks,
-        vesting_weeks,
-        start_time,
-    ]
+    # Cancellable, 1 year cliff, vesting over 88 weeks
+    vesting_params_list = make_vesting_parameters(vesting_weeks=88)
 
     ## Buy Vesting Tokens ##
 
-    dai_approval_tx = dai_contract.approve(
-        vesting_executor_address, dai_approval, {"from": dai_whale}
-    )
-
     purchase_tx = vesting_executor.purchaseVestingToken(
         desired_eefi_amount * eefi_token_decimals,
         dai_token_address,
@@ -710,13 +331,10 @@ def test_vesting_claim_not_vestor(
 
     # Move Chain Forward ##
 
-    unix_seconds_in_a_day = 86399
     days = 375
-    unix_time_elapsed = int(unix_seconds_in_a_day * days)
-
-    unix_time_at_end_of_vesting = int(start_time + unix_time_elapsed)
 
-    chain.mine(1, unix_time_at_end_of_vesting)
+    chain.sleep(SECONDS_PER_DAY * days)
+    chain.mine()
 
     ## Test Actions ##
 
@@ -733,40 +351,28 @@ def test_vesting_claim_not_vestor(
             account_vesting_number,
             dai_whale_address,
             eefi_contract.address,
-            {"from": accounts[1]},
+            {"from": accounts[1], "gas_limit": 500000, "allow_revert": True},
         )
 
     with capsys.disabled():
         print("Claim should fail because msg.sender is not vestor")
 
 #Test token withdrawal from token lock contract 
-def test_token_lock_contract_withdrawal_not_owner(tokenlock, main, capsys):
+def test_token_lock_contract_withdrawal_not_owner(
+    funded_tokenlock, main, eefi_contract, transfer_amount, capsys
+):
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    token_lock_address = tokenlock
-
-    eefi_approval = 500000 * 10**18
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        token_lock_address, transfer_amount, {"from": eefi_whale}
-    )
+    token_lock_address = funded_tokenlock
 
     contract_eefi_balance = eefi_contract.balanceOf(token_lock_address)
 
-    transfer_amount = 5000 * 10**18
-
     assert (
         contract_eefi_balance == transfer_amount
     ), "tokens not successfully transfered"
     
     with brownie.reverts('Ownable: caller is not the owner'):
-        withdraw_eefi_balance = vesting_executor.transferLockedTokens(eefi_contract.address, accounts[1], transfer_amount, {"from": accounts[0]})
+        withdraw_eefi_balance = vesting_executor.transferLockedTokens(eefi_contract.address, accounts[1], transfer_amount, {"from": accounts[0], "gas_limit": 500000, "allow_revert": True})
     
     with capsys.disabled():
         print("Withdrawal should fail because sender is not owner")
@@ -774,7 +380,15 @@ def test_token_lock_contract_withdrawal_not_owner(tokenlock, main, capsys):
 # #### ----- Purchase Calculation Checks  ----- #####
 
 def test_purchase_vesting_calc_usdc(
-    set_vesting_token, standard_vesting_parameters, vesting_manager, main, capsys
+    set_vesting_token,
+    standard_vesting_parameters,
+    approvals,
+    funded_manager,
+    main,
+    eefi_contract,
+    usdc_contract,
+    usdc_whale,
+    capsys,
 ):
     # ## Test Setup ##
 
@@ -782,25 +396,9 @@ def test_purchase_vesting_calc_usdc(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    usdc_contract = Contract("0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48")
-
     usdc_token_address = usdc_contract.address
 
-    usdc_whale = accounts.at("0x7B299ff0Bf1531C095bBE63bCF79af31eEA418Da", force=True)
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Set Threshold and Release Percentage #
-
-    purchase_amount_threshold = 3000
-
-    vesting_executor.setPurchaseAmountThreshold(
-        purchase_amount_threshold, {"from": accounts[1]}
-    )  # Set threshold
+    # Set Release Percentage #
 
     release_percentage = 2.5 * 10**4
 
@@ -812,28 +410,10 @@ def test_purchase_vesting_calc_usdc(
 
     vesting_token_price = 12
 
-    usdc_approval = 500000 * 10**6
-
     desired_eefi_amount = 426.258897
 
     purchase_amount = (desired_eefi_amount * vesting_token_price) * 10**6
 
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 15000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address,
-        transfer_amount,
-        {
-            "from": eefi_whale,
-        },
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
     vesting_params_list = standard_vesting_parameters
@@ -850,10 +430,6 @@ def test_purchase_vesting_calc_usdc(
 
     ## Test Actions ##
 
-    usdc_approval_tx = usdc_contract.approve(
-        vesting_executor_address, usdc_approval, {"from": usdc_whale}
-    )
-
     purchase_tx = vesting_executor.purchaseVestingToken(
         desired_eefi_amount * eefi_token_decimals,
         usdc_token_address,
@@ -864,20 +440,28 @@ def test_purchase_vesting_calc_usdc(
     release_percentage_decimal = 2.5 / 100
 
     eefi_purchase_price_usdc = (vesting_token_price * desired_eefi_amount) * 10 ** 6
-    contract_calc_purchase_price_usdc = int(purchase_tx.events[0]["number"]) 
+    contract_calc_purchase_price_usdc = int(purchase_tx.events["processLog"][0]["number"]) 
 
-    assert math.isclose(
-        eefi_purchase_price_usdc, contract_calc_purchase_price_usdc, rel_tol=0.005
-    ), f"The calculated amount to spend ({eefi_purchase_price_usdc}) and the amount to spend calculated by the contract ({contract_calc_purchase_price_usdc}) are not as close as expected."
+    assert contract_calc_purchase_price_usdc == pytest.approx(
+        eefi_purchase_price_usdc, rel=0.005
+    )
 
     with capsys.disabled():
         print(eefi_purchase_price_usdc/ 10 ** 6)
         print(contract_calc_purchase_price_usdc / 10 ** 6)
-        print(purchase_tx.events[0])
+        print(purchase_tx.events["processLog"][0])
 
 # Purchase fractions of vesting asset
 def test_purchase_vesting_calc_dai(
-    set_vesting_token, standard_vesting_parameters, vesting_manager, main, capsys
+    set_vesting_token,
+    standard_vesting_parameters,
+    approvals,
+    funded_manager,
+    main,
+    eefi_contract,
+    dai_contract,
+    dai_whale,
+    capsys,
 ):
     # ## Test Setup ##
 
@@ -885,54 +469,16 @@ def test_purchase_vesting_calc_dai(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    dai_contract = Contract("0x6B175474E89094C44Da98b954EedeAC495271d0F")
-
     dai_token_address = dai_contract.address
 
-    dai_whale = accounts.at("0x748dE14197922c4Ae258c7939C7739f3ff1db573", force=True)
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Set Threshold and Release Percentage #
-
-    purchase_amount_threshold = 3000
-
-    vesting_executor.setPurchaseAmountThreshold(
-        purchase_amount_threshold, {"from": accounts[1]}
-    )  # Set threshold
-
-    release_percentage = 2 * 10**4
-
-    vesting_executor.setReleasePercentage(
-        release_percentage, {"from": accounts[1]}
-    )  # Set release percentage
-
     # Vesting Token Pricing #
 
     vesting_token_price = 12
 
-    dai_approval = 500000 * 10**18
-
     desired_eefi_amount = 330.50
 
     purchase_amount = (desired_eefi_amount * vesting_token_price) * 10**18
 
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
     vesting_params_list = standard_vesting_parameters
@@ -943,10 +489,6 @@ def test_purchase_vesting_calc_dai(
 
     ## Test Actions ##
 
-    dai_approval_tx = dai_contract.approve(
-        vesting_executor_address, dai_approval, {"from": dai_whale}
-    )
-
     purchase_tx = vesting_executor.purchaseVestingToken(
         desired_eefi_amount * 10**18,
         dai_token_address,
@@ -960,22 +502,30 @@ def test_purchase_vesting_calc_dai(
     bonus_amount = float(desired_eefi_amount * release_percentage_decimal)
 
     eefi_purchase_price_dai = (vesting_token_price * desired_eefi_amount) * 10 ** 18
-    contract_calc_purchase_price_dai = int(purchase_tx.events[0]["number"]) 
+    contract_calc_purchase_price_dai = int(purchase_tx.events["processLog"][0]["number"]) 
 
-    assert math.isclose(
-        eefi_purchase_price_dai, contract_calc_purchase_price_dai, rel_tol=0.005
-    ), f"The calculated amount to spend ({eefi_purchase_price_dai}) and the amount to spend calculated by the contract ({contract_calc_purchase_price_dai}) are not as close as expected."
+    assert contract_calc_purchase_price_dai == pytest.approx(
+        eefi_purchase_price_dai, rel=0.005
+    )
         
        
     with capsys.disabled():
         print(eefi_purchase_price_dai/ 10 ** 18)
         print(contract_calc_purchase_price_dai / 10 ** 18)
-        print(purchase_tx.events[0])
+        print(purchase_tx.events["processLog"][0])
 
 
 # Purchase fractions of vesting asset
 def test_purchase_vesting_calc_bonus(
-    set_vesting_token, standard_vesting_parameters, vesting_manager, main, capsys
+    set_vesting_token,
+    standard_vesting_parameters,
+    approvals,
+    funded_manager,
+    main,
+    eefi_contract,
+    dai_contract,
+    dai_whale,
+    capsys,
 ):
     # ## Test Setup ##
 
@@ -983,54 +533,16 @@ def test_purchase_vesting_calc_bonus(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    dai_contract = Contract("0x6B175474E89094C44Da98b954EedeAC495271d0F")
-
     dai_token_address = dai_contract.address
 
-    dai_whale = accounts.at("0x748dE14197922c4Ae258c7939C7739f3ff1db573", force=True)
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Set Threshold and Release Percentage #
-
-    purchase_amount_threshold = 3000
-
-    vesting_executor.setPurchaseAmountThreshold(
-        purchase_amount_threshold, {"from": accounts[1]}
-    )  # Set threshold
-
-    release_percentage = 2 * 10**4
-
-    vesting_executor.setReleasePercentage(
-        release_percentage, {"from": accounts[1]}
-    )  # Set release percentage
-
     # Vesting Token Pricing #
 
     vesting_token_price = 12
 
-    dai_approval = 500000 * 10**18
-
     desired_eefi_amount = 330.50
 
     purchase_amount = (desired_eefi_amount * vesting_token_price) * 10**18
 
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
     vesting_params_list = standard_vesting_parameters
@@ -1041,10 +553,6 @@ def test_purchase_vesting_calc_bonus(
 
     ## Test Actions ##
 
-    dai_approval_tx = dai_contract.approve(
-        vesting_executor_address, dai_approval, {"from": dai_whale}
-    )
-
     purchase_tx = vesting_executor.purchaseVestingToken(
         desired_eefi_amount * 10**18,
         dai_token_address,
@@ -1058,26 +566,33 @@ def test_purchase_vesting_calc_bonus(
     bonus_amount = float(desired_eefi_amount * release_percentage_decimal)
 
     eefi_bonus_calc = bonus_amount 
-    contract_calc_eefi_bonus = int(purchase_tx.events[3]["number"]) / 10 ** 18
+    contract_calc_eefi_bonus = int(purchase_tx.events["processLog"][2]["number"]) / 10 ** 18
 
-    assert math.isclose(
-        eefi_bonus_calc,  contract_calc_eefi_bonus, rel_tol=0.005
-    ), f"The calculated bonus amount ({eefi_bonus_calc}) and the bonus amount calculated by the contract ({contract_calc_eefi_bonus}) are not as close as expected."
+    assert contract_calc_eefi_bonus == pytest.approx(eefi_bonus_calc, rel=0.005)
         
        
     with capsys.disabled():
         print(eefi_bonus_calc)
         print(contract_calc_eefi_bonus)
-        print(purchase_tx.events[3])
+        print(purchase_tx.events["processLog"][2])
 
 
 
 # #### ----- Vesting Asset Purchases, Swaps and Standard Vesting  ----- #####
 
 
-# Purchase vesting asset with USDC, release portion of vesting asset allocation to purchaser
-def test_purchase_vesting_token_usdc(
-    set_vesting_token, standard_vesting_parameters, vesting_manager, main, capsys
+# Purchase vesting asset with a stablecoin, release portion of vesting asset allocation to purchaser
+@pytest.mark.parametrize("stable", ["usdc", "dai"], indirect=True)
+def test_purchase_vesting_token(
+    set_vesting_token,
+    standard_vesting_parameters,
+    approvals,
+    funded_manager,
+    main,
+    eefi_contract,
+    stable,
+    verbose,
+    capsys,
 ):
     # ## Test Setup ##
 
@@ -1085,27 +600,9 @@ def test_purchase_vesting_token_usdc(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    usdc_contract = Contract("0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48")
-
-    usdc_token_address = usdc_contract.address
-
-    usdc_whale = accounts.at("0x7B299ff0Bf1531C095bBE63bCF79af31eEA418Da", force=True)
-
-    vesting_executor_address = vesting_executor.address
+    stable_contract, stable_whale, stable_decimals, release_percentage = stable
 
-    vesting_manager_address = vesting_manager
-
-    # Set Threshold and Release Percentage #
-
-    purchase_amount_threshold = 3000
-
-    vesting_executor.setPurchaseAmountThreshold(
-        purchase_amount_threshold, {"from": accounts[1]}
-    )  # Set threshold
-
-    release_percentage = 2.5 * 10**4
+    # Set Release Percentage #
 
     vesting_executor.setReleasePercentage(
         release_percentage, {"from": accounts[1]}
@@ -1113,80 +610,54 @@ def test_purchase_vesting_token_usdc(
 
     # Vesting Token Pricing #
 
-    vesting_token_price = 12
-
-    usdc_approval = 500000 * 10**6
-
     desired_eefi_amount = 426.258897
 
-    purchase_amount = (desired_eefi_amount * vesting_token_price) * 10**6
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 15000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address,
-        transfer_amount,
-        {
-            "from": eefi_whale,
-        },
-    )
+    vesting_token_price = 12
 
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
+    purchase_amount = (desired_eefi_amount * vesting_token_price) * stable_decimals
 
     # Set up Vesting Parameters #
 
     vesting_params_list = standard_vesting_parameters
 
-    # Set Vesting Token
-
-    eefi_token_address = eefi_contract.address
-
-    eefi_token_decimals = 10**18
-
-    eefi_token_decimal_number = 18
-
-    set_vesting_token = set_vesting_token
-
     ## Test Actions ##
 
-    usdc_approval_tx = usdc_contract.approve(
-        vesting_executor_address, usdc_approval, {"from": usdc_whale}
-    )
-
     purchase_tx = vesting_executor.purchaseVestingToken(
-        desired_eefi_amount * eefi_token_decimals,
-        usdc_token_address,
+        desired_eefi_amount * 10**18,
+        stable_contract.address,
         eefi_contract.address,
         vesting_params_list,
-        {"from": usdc_whale},
+        {"from": stable_whale},
     )
-    release_percentage_decimal = 2.5 / 100
 
-    bonus_amount = float(desired_eefi_amount * release_percentage_decimal)
+    release_percentage_decimal = release_percentage / 10**6
 
-    eefi_vested = desired_eefi_amount - bonus_amount
+    bonus_amount = float(desired_eefi_amount * release_percentage_decimal)
 
-    vested_amount_contract = int(purchase_tx.events[-1]["vestedAssetAmount"]) / 10**18
+    eefi_vested = (desired_eefi_amount - bonus_amount) * 10**18
 
+    vested_amount_contract = purchase_tx.events["vestingPurchaseTransactionComplete"]["vestedAssetAmount"]
 
-    assert math.isclose(
-        vested_amount_contract, eefi_vested, rel_tol=0.005
-    ), f"The amount vested ({vested_amount_contract}) and the expected amount ({eefi_vested}) are not as close as expected."
+    assert vested_amount_contract == pytest.approx(eefi_vested, rel=0.005)
 
     with capsys.disabled():
-        print(purchase_tx.events[-1])
-        print(purchase_tx.info())
-        # print(vested_amount_contract)
-        print("USDC whale balance", usdc_contract.balanceOf(usdc_whale))
+        print(vested_amount_contract)
+        verbose(purchase_tx.info)
+        verbose(lambda: print("Whale balance", stable_contract.balanceOf(stable_whale)))
         print(("Purchase Amount", purchase_amount))
 
 
 def test_purchase_vesting_token_usdt(
-    set_vesting_token, standard_vesting_parameters, vesting_manager, main, capsys
+    set_vesting_token,
+    standard_vesting_parameters,
+    approvals,
+    funded_manager,
+    main,
+    eefi_contract,
+    usdt_contract,
+    usdt_whale,
+    verbose,
+    capsys,
 ):
     # ## Test Setup ##
 
@@ -1194,54 +665,16 @@ def test_purchase_vesting_token_usdt(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    usdt_contract = Contract("0xdAC17F958D2ee523a2206206994597C13D831ec7")
-
     usdt_token_address = usdt_contract.address
 
-    usdt_whale = accounts.at("0x23eBA962AC256e4BDfEb926c438AD33f96a68042", force=True)
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Set Threshold and Release Percentage #
-
-    purchase_amount_threshold = 3000
-
-    vesting_executor.setPurchaseAmountThreshold(
-        purchase_amount_threshold, {"from": accounts[1]}
-    )  # Set threshold
-
-    release_percentage = 2 * 10**4
-
-    vesting_executor.setReleasePercentage(
-        release_percentage, {"from": accounts[1]}
-    )  # Set release percentage
-
     # Vesting Token Pricing #
 
     vesting_token_price = 12.25
 
-    usdt_approval = 500000 * 10**6
-
     desired_eefi_amount = 426.258897
 
     purchase_amount = (desired_eefi_amount * vesting_token_price) * 10**6
 
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
     vesting_params_list = standard_vesting_parameters
@@ -1258,10 +691,6 @@ def test_purchase_vesting_token_usdt(
 
     ## Test Actions ##
 
-    usdt_approval_tx = usdt_contract.approve(
-        vesting_executor_address, usdt_approval, {"from": usdt_whale}
-    )
-
     purchase_tx = vesting_executor.purchaseVestingToken(
         desired_eefi_amount * eefi_token_decimals,
         usdt_token_address,
@@ -1275,122 +704,27 @@ def test_purchase_vesting_token_usdt(
 
     eefi_vested = (desired_eefi_amount - bonus_amount) * 10**18
 
-    vested_amount_contract = purchase_tx.events[-1]["vestedAssetAmount"]
+    vested_amount_contract = purchase_tx.events["vestingPurchaseTransactionComplete"]["vestedAssetAmount"]
 
-    assert math.isclose(
-        vested_amount_contract, eefi_vested, rel_tol=0.005
-    ), f"The amount vested ({vested_amount_contract}) and the expected amount ({eefi_vested}) are not as close as expected."
+    assert vested_amount_contract == pytest.approx(eefi_vested, rel=0.005)
 
     with capsys.disabled():
-        print(purchase_tx.events[-1])
-        print(purchase_tx.info())
+        print(purchase_tx.events["vestingPurchaseTransactionComplete"])
+        verbose(purchase_tx.info)
         # print(vested_amount_contract)
-        print("USDT whale balance", usdt_contract.balanceOf(usdt_whale))
-        print(("Purchase Amount", purchase_amount))
-
-
-# Purchase asset with DAI, vest, release portion of vesting asset allocation to purchaser
-def test_purchase_vesting_token_dai(
-    set_vesting_token, standard_vesting_parameters, vesting_manager, main, capsys
-):
-    # ## Test Setup ##
-
-    # Contracts #
-
-    vesting_executor = main
-
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    dai_contract = Contract("0x6B175474E89094C44Da98b954EedeAC495271d0F")
-
-    dai_token_address = dai_contract.address
-
-    dai_whale = accounts.at("0x748dE14197922c4Ae258c7939C7739f3ff1db573", force=True)
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Set Threshold and Release Percentage #
-
-    purchase_amount_threshold = 3000
-
-    vesting_executor.setPurchaseAmountThreshold(
-        purchase_amount_threshold, {"from": accounts[1]}
-    )  # Set threshold
-
-    release_percentage = 2 * 10**4
-
-    vesting_executor.setReleasePercentage(
-        release_percentage, {"from": accounts[1]}
-    )  # Set release percentage
-
-    # Vesting Token Pricing #
-
-    dai_approval = 500000 * 10**18
-
-    desired_eefi_amount = 426.258897
-
-    vesting_token_price = 12.25
-
-    purchase_amount = (desired_eefi_amount * vesting_token_price) * 10**18
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
-    # Set up Vesting Parameters #
-
-    vesting_params_list = standard_vesting_parameters
-
-    # Set Vesting Token
-
-    set_vesting_token = set_vesting_token
-
-    ## Test Actions ##
-
-    dai_approval_tx = dai_contract.approve(
-        vesting_executor_address, dai_approval, {"from": dai_whale}
-    )
-
-    purchase_tx = vesting_executor.purchaseVestingToken(
-        desired_eefi_amount * 10**18,
-        dai_token_address,
-        eefi_contract.address,
-        vesting_params_list,
-        {"from": dai_whale},
-    )
-
-    release_percentage_decimal = 0.02
-
-    bonus_amount = float(desired_eefi_amount * release_percentage_decimal)
-
-    eefi_vested = (desired_eefi_amount - bonus_amount) * 10**18
-
-    vested_amount_contract = purchase_tx.events[-1]["vestedAssetAmount"]
-
-    assert math.isclose(
-        vested_amount_contract, eefi_vested, rel_tol=0.005
-    ), f"The amount vested ({vested_amount_contract}) and the expected amount ({eefi_vested}) are not as close as expected."
-
-    with capsys.disabled():
-        print(vested_amount_contract)
-        print(purchase_tx.info())
-        print("DAI whale balance", dai_contract.balanceOf(dai_whale))
+        verbose(lambda: print("USDT whale balance", usdt_contract.balanceOf(usdt_whale)))
         print(("Purchase Amount", purchase_amount))
 
 
 # Vest assets for address (owner-only), used to vest team assets
 def test_standard_vesting(
-    set_vesting_token, standard_vesting_parameters, vesting_manager, main, capsys
+    set_vesting_token,
+    standard_vesting_parameters,
+    funded_manager,
+    main,
+    eefi_contract,
+    verbose,
+    capsys,
 ):
     # ## Test Setup ##
 
@@ -1398,24 +732,6 @@ def test_standard_vesting(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
     vesting_params_list = standard_vesting_parameters
@@ -1434,22 +750,39 @@ def test_standard_vesting(
     )
 
     assert (
-        standard_vesting_transaction.events[0]["asset"] == eefi_contract.address
+        standard_vesting_transaction.events["VestingScheduleCreated"]["asset"] == eefi_contract.address
     ), "Vesting token was not successfully vested"
 
-    contract_vested_amount = int(standard_vesting_transaction.events[0]["amount"])
+    contract_vested_amount = int(standard_vesting_transaction.events["VestingScheduleCreated"]["amount"])
 
     assert contract_vested_amount == eefi_vesting_amount, "Vested token amount mismatch"
 
     with capsys.disabled():
-        print(standard_vesting_transaction.info())
+        verbose(standard_vesting_transaction.info)
         print(standard_vesting_transaction.events)
 
 
 # Swap asset for vested asset (includes setting swap ratio), used to swap old asset for new asset and vest
-# Asset is deposited into the Token Lock contract
+# Asset is deposited into the Token Lock contract, or into the Treasury when token lock is inactive
+@pytest.mark.parametrize(
+    "token_lock_status, swap_token_amount",
+    [(0, 252.36585), (1, 632.89652)],
+    ids=["token_lock", "treasury"],
+)
 def test_swap_and_vest(
-    set_vesting_token, standard_vesting_parameters, vesting_manager, main, capsys, chain
+    set_vesting_token,
+    standard_vesting_parameters,
+    approvals,
+    funded_manager,
+    tokenlock,
+    main,
+    eefi_contract,
+    eefi_whale,
+    token_lock_status,
+    swap_token_amount,
+    verbose,
+    capsys,
+    chain,
 ):
     ## Test Setup ##
 
@@ -1457,23 +790,7 @@ def test_swap_and_vest(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 1500 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
+    treasury_address = "0xf950a86013bAA227009771181a885E369e158da3"
 
     # Set up Vesting Parameters #
 
@@ -1487,9 +804,9 @@ def test_swap_and_vest(
 
     vesting_executor.setSwappingStatus(swap_status)  # Set status
 
-    swapping_status = vesting_executor.current_swapping_status()  # Check status
+    # Token Lock Status (0: Active, 1: Inactive)
 
-    assert swap_status == swapping_status, "Swapping status not set to active"
+    vesting_executor.setTokenLockStatus(token_lock_status)  # Set status
 
     # Swap Ratio
 
@@ -1499,10 +816,6 @@ def test_swap_and_vest(
 
     vesting_executor.setSwapRatio(swap_ratio_scaled, {"from": accounts[1]})
 
-    contract_swap_ratio = vesting_executor.swapRatio()
-
-    assert contract_swap_ratio == swap_ratio_scaled, "Swap ratio not set properly"
-
     # Add Authorized Swap Token
 
     swap_token_address = eefi_contract.address
@@ -1513,8 +826,19 @@ def test_swap_and_vest(
         swap_token_address, swap_token_decimals, {"from": accounts[1]}
     )
 
-    swap_token_details = vesting_executor.authorizedSwapTokens(swap_token_address)
+    # Check Swap Settings (batched into a single call)
+
+    with multicall(address=MULTICALL3_ADDRESS):
+        swapping_status = vesting_executor.current_swapping_status()
+        token_lock_status_contract = vesting_executor.current_token_lock_status()
+        contract_swap_ratio = vesting_executor.swapRatio()
+        swap_token_details = vesting_executor.authorizedSwapTokens(swap_token_address)
 
+    assert swap_status == swapping_status, "Swapping status not set to active"
+    assert (
+        token_lock_status == token_lock_status_contract
+    ), "Token lock status not set properly"
+    assert contract_swap_ratio == swap_ratio_scaled, "Swap ratio not set properly"
     assert (
         swap_token_details[0] == swap_token_address
     ), "Swap token address not set properly"
@@ -1528,20 +852,12 @@ def test_swap_and_vest(
 
     # Swap Transaction
 
-    swap_token_amount = 252.36585
-
     swap_token_decimals = 10**18
 
     token_to_swap = eefi_contract.address
 
-    eefi_approval = 5000 * 10**18
-
     vesting_token_decimals = 10**18
 
-    eefi_approval_tx = eefi_contract.approve(
-        vesting_executor_address, eefi_approval, {"from": eefi_whale}
-    )
-
     swap_and_vest_transaction = vesting_executor.swapAndVest(
         swap_token_amount * swap_token_decimals,
         token_to_swap,
@@ -1549,21 +865,36 @@ def test_swap_and_vest(
         {"from": eefi_whale},
     )
 
+    swap_token_destination = tokenlock if token_lock_status == 0 else treasury_address
+
+    assert (
+        swap_and_vest_transaction.events["Transfer"][1]["to"] == swap_token_destination
+    ), "Token not transferred to expected address"
+
     expected_vested_token_amount = swap_token_amount * swap_ratio
     contract_vested_token_amount = (
-        int(swap_and_vest_transaction.events[-2]["amount"]) / vesting_token_decimals
+        int(swap_and_vest_transaction.events["VestingScheduleCreated"]["amount"]) / vesting_token_decimals
     )
 
-    assert math.isclose(
-        expected_vested_token_amount, contract_vested_token_amount, rel_tol=0.005
-    ), f"The amount vested ({contract_vested_token_amount}) and the expected amount ({expected_vested_token_amount}) are not as close as expected."
+    assert contract_vested_token_amount == pytest.approx(
+        expected_vested_token_amount, rel=0.005
+    )
 
     with capsys.disabled():
-        print(swap_and_vest_transaction.info())
+        verbose(swap_and_vest_transaction.info)
 
 
 def test_swap_and_vest_whitelist(
-    set_vesting_token, standard_vesting_parameters, vesting_manager, main, capsys, chain
+    set_vesting_token,
+    standard_vesting_parameters,
+    approvals,
+    funded_manager,
+    main,
+    eefi_contract,
+    eefi_whale,
+    verbose,
+    capsys,
+    chain,
 ):
     ## Test Setup ##
 
@@ -1571,24 +902,6 @@ def test_swap_and_vest_whitelist(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 1500 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
     vesting_params_list = standard_vesting_parameters
@@ -1601,8 +914,6 @@ def test_swap_and_vest_whitelist(
 
     vesting_executor.setSwappingStatus(swap_status)  # Set status
 
-    swapping_status = vesting_executor.current_swapping_status()  # Check status
-
     # Swap Ratio (Set to 1 for whitelisted addresses)
 
     swap_ratio = 1
@@ -1611,8 +922,6 @@ def test_swap_and_vest_whitelist(
 
     vesting_executor.setSwapRatio(swap_ratio_scaled, {"from": accounts[1]})
 
-    contract_swap_ratio = vesting_executor.swapRatio()
-
     # Add Authorized Swap Token
 
     swap_token_address = eefi_contract.address
@@ -1623,7 +932,21 @@ def test_swap_and_vest_whitelist(
         swap_token_address, swap_token_decimals, {"from": accounts[1]}
     )
 
-    swap_token_details = vesting_executor.authorizedSwapTokens(swap_token_address)
+    # Check Swap Settings (batched into a single call)
+
+    with multicall(address=MULTICALL3_ADDRESS):
+        swapping_status = vesting_executor.current_swapping_status()
+        contract_swap_ratio = vesting_executor.swapRatio()
+        swap_token_details = vesting_executor.authorizedSwapTokens(swap_token_address)
+
+    assert swap_status == swapping_status, "Swapping status not set to active"
+    assert contract_swap_ratio == swap_ratio_scaled, "Swap ratio not set properly"
+    assert (
+        swap_token_details[0] == swap_token_address
+    ), "Swap token address not set properly"
+    assert (
+        swap_token_details[1] == swap_token_decimals
+    ), "Swap token decimals not set properly"
 
     # Add Vesting Token
 
@@ -1657,14 +980,8 @@ def test_swap_and_vest_whitelist(
 
     token_to_swap = eefi_contract.address
 
-    eefi_approval = 5000 * 10**18
-
     vesting_token_decimals = 10**18
 
-    eefi_approval_tx = eefi_contract.approve(
-        vesting_executor_address, eefi_approval, {"from": eefi_whale}
-    )
-
     swap_and_vest_transaction = vesting_executor.swapAndVest(
         swap_token_amount * swap_token_decimals,
         token_to_swap,
@@ -1674,19 +991,27 @@ def test_swap_and_vest_whitelist(
 
     expected_vested_token_amount = swap_token_amount * swap_ratio
     contract_vested_token_amount = (
-        int(swap_and_vest_transaction.events[-2]["amount"]) / vesting_token_decimals
+        int(swap_and_vest_transaction.events["VestingScheduleCreated"]["amount"]) / vesting_token_decimals
     )
 
-    assert math.isclose(
-        expected_vested_token_amount, contract_vested_token_amount, rel_tol=0.005
-    ), f"The amount vested ({contract_vested_token_amount}) and the expected amount ({expected_vested_token_amount}) are not as close as expected."
+    assert contract_vested_token_amount == pytest.approx(
+        expected_vested_token_amount, rel=0.005
+    )
 
     with capsys.disabled():
-        print(swap_and_vest_transaction.info())
+        verbose(swap_and_vest_transaction.info)
 
 
 def test_swap_and_vest_not_on_whitelist(
-    set_vesting_token, standard_vesting_parameters, vesting_manager, main, capsys, chain
+    set_vesting_token,
+    standard_vesting_parameters,
+    approvals,
+    funded_manager,
+    main,
+    eefi_contract,
+    eefi_whale,
+    capsys,
+    chain,
 ):
     ## Test Setup ##
 
@@ -1694,24 +1019,6 @@ def test_swap_and_vest_not_on_whitelist(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 1500 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
     vesting_params_list = standard_vesting_parameters
@@ -1724,8 +1031,6 @@ def test_swap_and_vest_not_on_whitelist(
 
     vesting_executor.setSwappingStatus(swap_status)  # Set status
 
-    swapping_status = vesting_executor.current_swapping_status()  # Check status
-
     # Swap Ratio (Set to 1 for whitelisted addresses)
 
     swap_ratio = 1
@@ -1734,8 +1039,6 @@ def test_swap_and_vest_not_on_whitelist(
 
     vesting_executor.setSwapRatio(swap_ratio_scaled, {"from": accounts[1]})
 
-    contract_swap_ratio = vesting_executor.swapRatio()
-
     # Add Authorized Swap Token
 
     swap_token_address = eefi_contract.address
@@ -1746,7 +1049,21 @@ def test_swap_and_vest_not_on_whitelist(
         swap_token_address, swap_token_decimals, {"from": accounts[1]}
     )
 
-    swap_token_details = vesting_executor.authorizedSwapTokens(swap_token_address)
+    # Check Swap Settings (batched into a single call)
+
+    with multicall(address=MULTICALL3_ADDRESS):
+        swapping_status = vesting_executor.current_swapping_status()
+        contract_swap_ratio = vesting_executor.swapRatio()
+        swap_token_details = vesting_executor.authorizedSwapTokens(swap_token_address)
+
+    assert swap_status == swapping_status, "Swapping status not set to active"
+    assert contract_swap_ratio == swap_ratio_scaled, "Swap ratio not set properly"
+    assert (
+        swap_token_details[0] == swap_token_address
+    ), "Swap token address not set properly"
+    assert (
+        swap_token_details[1] == swap_token_decimals
+    ), "Swap token decimals not set properly"
 
     # Add Vesting Token
 
@@ -1780,165 +1097,32 @@ def test_swap_and_vest_not_on_whitelist(
 
     token_to_swap = eefi_contract.address
 
-    eefi_approval = 5000 * 10**18
-
     vesting_token_decimals = 10**18
 
-    eefi_approval_tx = eefi_contract.approve(
-        vesting_executor_address, eefi_approval, {"from": eefi_whale}
-    )
-
     with brownie.reverts("Sender is not on whitelist"):
         swap_and_vest_transaction = vesting_executor.swapAndVest(
             swap_token_amount * swap_token_decimals,
             token_to_swap,
             vesting_params_list,
-            {"from": eefi_whale},
+            {"from": eefi_whale, "gas_limit": 500000, "allow_revert": True},
         )
 
     with capsys.disabled():
         print("Swap transaction should revert because swapper is not on whitelist")
 
 
-# Swap asset for vested asset (includes setting swap ratio), used to swap old asset for new asset and vest
-# Token lock is set to inactive and asset is deposited into the Treasury contract
-def test_swap_and_vest_treasury(
-    set_vesting_token, standard_vesting_parameters, vesting_manager, main, capsys, chain
-):
-    ## Test Setup ##
-
-    # Contracts #
-
-    vesting_executor = main
-
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 1500 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
-    # Set up Vesting Parameters #
-
-    vesting_params_list = standard_vesting_parameters
-
-    ## Test Actions ##
-
-    # Swap Status
-
-    swap_status = 0  # Active
-
-    vesting_executor.setSwappingStatus(swap_status)  # Set status
-
-    swapping_status = vesting_executor.current_swapping_status()  # Check status
-
-    assert swap_status == swapping_status, "Swapping status not set to active"
-
-    # Token Lock Status
-
-    token_lock_status = 1  # Inactive
-
-    vesting_executor.setTokenLockStatus(token_lock_status)  # Set status
-
-    token_lock_status_contract = (
-        vesting_executor.current_token_lock_status()
-    )  # Check status
-
-    assert (
-        token_lock_status == token_lock_status_contract
-    ), "Token locking not set to inactive"
-
-    # Swap Ratio
-
-    swap_ratio = 0.25
-
-    swap_ratio_scaled = 0.25 * 10**4
-
-    vesting_executor.setSwapRatio(swap_ratio_scaled, {"from": accounts[1]})
-
-    contract_swap_ratio = vesting_executor.swapRatio()
-
-    assert contract_swap_ratio == swap_ratio_scaled, "Swap ratio not set properly"
-
-    # Add Authorized Swap Token
-
-    swap_token_address = eefi_contract.address
-
-    swap_token_decimals = 10**18
-
-    set_swap_token = vesting_executor.addAuthorizedSwapToken(
-        swap_token_address, swap_token_decimals, {"from": accounts[1]}
-    )
-
-    swap_token_details = vesting_executor.authorizedSwapTokens(swap_token_address)
-
-    assert (
-        swap_token_details[0] == swap_token_address
-    ), "Swap token address not set properly"
-    assert (
-        swap_token_details[1] == swap_token_decimals
-    ), "Swap token decimals not set properly"
-
-    # Add Vesting Token
-
-    set_vesting_token = set_vesting_token
-
-    # Swap Transaction
-
-    swap_token_amount = 632.89652
-
-    swap_token_decimals = 10**18
-
-    token_to_swap = eefi_contract.address
-
-    eefi_approval = 5000 * 10**18
-
-    vesting_token_decimals = 10**18
-
-    eefi_approval_tx = eefi_contract.approve(
-        vesting_executor_address, eefi_approval, {"from": eefi_whale}
-    )
-
-    swap_and_vest_transaction = vesting_executor.swapAndVest(
-        swap_token_amount * swap_token_decimals,
-        token_to_swap,
-        vesting_params_list,
-        {"from": eefi_whale},
-    )
-
-    treasury_address = "0xf950a86013bAA227009771181a885E369e158da3"
-
-    assert (
-        swap_and_vest_transaction.events[3]["to"] == treasury_address
-    ), "Token not transferred to Treasury address"
-
-    expected_vested_token_amount = swap_token_amount * swap_ratio
-    contract_vested_token_amount = (
-        int(swap_and_vest_transaction.events[-2]["amount"]) / vesting_token_decimals
-    )
-
-    assert math.isclose(
-        expected_vested_token_amount, contract_vested_token_amount, rel_tol=0.005
-    ), f"The amount vested ({contract_vested_token_amount}) and the expected amount ({expected_vested_token_amount}) are not as close as expected."
-
-    with capsys.disabled():
-        print(swap_and_vest_transaction.info())
-
-
 # Purchase is less than purchase price threshold (no bonus provided)
 def test_purchase_vesting_token_purchase_price_lower_than_threshold(
-    set_vesting_token, standard_vesting_parameters, vesting_manager, main, capsys
+    set_vesting_token,
+    standard_vesting_parameters,
+    approvals,
+    funded_manager,
+    main,
+    eefi_contract,
+    dai_contract,
+    dai_whale,
+    verbose,
+    capsys,
 ):
     # ## Test Setup ##
 
@@ -1946,54 +1130,17 @@ def test_purchase_vesting_token_purchase_price_lower_than_threshold(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    dai_contract = Contract("0x6B175474E89094C44Da98b954EedeAC495271d0F")
-
     dai_token_address = dai_contract.address
 
-    dai_whale = accounts.at("0x748dE14197922c4Ae258c7939C7739f3ff1db573", force=True)
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Set Threshold and Release Percentage #
-
-    purchase_amount_threshold = 3000
-
-    vesting_executor.setPurchaseAmountThreshold(
-        purchase_amount_threshold, {"from": accounts[1]}
-    )  # Set threshold
-
-    release_percentage = 2 * 10**4
-
-    vesting_executor.setReleasePercentage(
-        release_percentage, {"from": accounts[1]}
-    )  # Set release percentage
-
     # Vesting Token Pricing #
 
     vesting_token_price = 12
 
-    dai_approval = 500000 * 10**18
-
+    # Purchase stays below the 3000 threshold set by configured_executor
     desired_eefi_amount = 25.786
 
     purchase_amount = (desired_eefi_amount * vesting_token_price) * 10**18
 
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
     vesting_params_list = standard_vesting_parameters
@@ -2008,10 +1155,6 @@ def test_purchase_vesting_token_purchase_price_lower_than_threshold(
 
     ## Test Actions ##
 
-    dai_approval_tx = dai_contract.approve(
-        vesting_executor_address, dai_approval, {"from": dai_whale}
-    )
-
     purchase_tx = vesting_executor.purchaseVestingToken(
         desired_eefi_amount * eefi_token_decimals,
         dai_token_address,
@@ -2023,12 +1166,12 @@ def test_purchase_vesting_token_purchase_price_lower_than_threshold(
     scaled_desired_eefi_amount = desired_eefi_amount * 10**18
 
     assert (
-        float(purchase_tx.events[-1]["vestedAssetAmount"]) == scaled_desired_eefi_amount
+        float(purchase_tx.events["vestingPurchaseTransactionComplete"]["vestedAssetAmount"]) == scaled_desired_eefi_amount
     ), "Purchase amount not expected amount"
 
     with capsys.disabled():
-        print(purchase_tx.info())
-        print("DAI whale balance", dai_contract.balanceOf(dai_whale))
+        verbose(purchase_tx.info)
+        verbose(lambda: print("DAI whale balance", dai_contract.balanceOf(dai_whale)))
         print(("Purchase Amount", purchase_amount))
 
 
@@ -2036,46 +1179,24 @@ def test_purchase_vesting_token_purchase_price_lower_than_threshold(
 
 
 # Claim standard vested asset after 1 year (note that contract claims on behalf of user, but token is sent to schedule holder)
-def test_vesting_claim_standard_vest(vesting_manager, main, capsys, chain):
+def test_vesting_claim_standard_vest(
+    standard_vesting_parameters,
+    funded_manager,
+    main,
+    eefi_contract,
+    verbose,
+    capsys,
+    chain,
+):
     # ## Test Setup ##
 
     # Contracts #
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
-    asset_address = eefi_contract.address
-    is_fixed = False
-    cliff_weeks = 52  # 1 year
-    vesting_weeks = 55  # Vesting occurs over 3 weeks post-cliff
-    start_time = time.time()  # Current time in UNIX
-
-    vesting_params_list = [
-        asset_address,
-        is_fixed,
-        cliff_weeks,
-        vesting_weeks,
-        start_time,
-    ]
+    vesting_params_list = standard_vesting_parameters
 
     # Vest Tokens #
 
@@ -2092,13 +1213,10 @@ def test_vesting_claim_standard_vest(vesting_manager, main, capsys, chain):
 
     # Move Chain Forward ##
 
-    unix_seconds_in_a_day = 86399
     days = 365
-    unix_time_elapsed = int(unix_seconds_in_a_day * days)
 
-    unix_time_at_end_of_vesting = int(start_time + unix_time_elapsed)
-
-    chain.mine(1, unix_time_at_end_of_vesting)
+    chain.sleep(SECONDS_PER_DAY * days)
+    chain.mine()
     ## Test Actions ##
 
     account_vesting_schedule = vesting_executor.retrieveScheduleInfo(vestor_address)
@@ -2114,19 +1232,29 @@ def test_vesting_claim_standard_vest(vesting_manager, main, capsys, chain):
     )
 
     assert (
-        account_claim_transaction.events[0]["to"] == vestor_address
+        account_claim_transaction.events["Transfer"]["to"] == vestor_address
     ), "Vesting claim did not succeed"
 
     with capsys.disabled():
-        print(standard_vesting_transaction.info())
+        verbose(standard_vesting_transaction.info)
         print(account_vesting_schedule)
-        print(account_claim_transaction.info())
+        verbose(account_claim_transaction.info)
         print(vestor_address)
 
 
 # #Claim purchased asset after 1 year
 def test_vesting_claim_purchase(
-    set_vesting_token, vesting_manager, main, capsys, chain
+    set_vesting_token,
+    make_vesting_parameters,
+    approvals,
+    funded_manager,
+    main,
+    eefi_contract,
+    dai_contract,
+    dai_whale,
+    verbose,
+    capsys,
+    chain,
 ):
     # ## Test Setup ##
 
@@ -2134,25 +1262,9 @@ def test_vesting_claim_purchase(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    dai_contract = Contract("0x6B175474E89094C44Da98b954EedeAC495271d0F")
-
     dai_token_address = dai_contract.address
 
-    dai_whale = accounts.at("0x748dE14197922c4Ae258c7939C7739f3ff1db573", force=True)
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Set Threshold and Release Percentage #
-
-    purchase_amount_threshold = 3000
-
-    vesting_executor.setPurchaseAmountThreshold(
-        purchase_amount_threshold, {"from": accounts[1]}
-    )  # Set threshold
+    # Set Release Percentage #
 
     release_percentage = 2.5 * 10**4
 
@@ -2164,24 +1276,10 @@ def test_vesting_claim_purchase(
 
     vesting_token_price = 12
 
-    dai_approval = 500000 * 10**18
-
     desired_eefi_amount = 300
 
     purchase_amount = (desired_eefi_amount * vesting_token_price) * 10**18
 
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set Vesting Token
 
     eefi_token_address = eefi_contract.address
@@ -2192,26 +1290,11 @@ def test_vesting_claim_purchase(
 
     # Set up Vesting Parameters #
 
-    asset_address = eefi_contract.address
-    is_fixed = False  # Vesting can be cancelled
-    cliff_weeks = 52  # 1 year
-    vesting_weeks = 88  # Vesting occurs over 3 weeks post-cliff
-    start_time = current_time = time.time()  # Current time in UNIX
-
-    vesting_params_list = [
-        asset_address,
-        is_fixed,
-        cliff_weeks,
-        vesting_weeks,
-        start_time,
-    ]
+    # Cancellable, 1 year cliff, vesting over 88 weeks
+    vesting_params_list = make_vesting_parameters(vesting_weeks=88)
 
     ## Buy Vesting Tokens ##
 
-    dai_approval_tx = dai_contract.approve(
-        vesting_executor_address, dai_approval, {"from": dai_whale}
-    )
-
     purchase_tx = vesting_executor.purchaseVestingToken(
         desired_eefi_amount * eefi_token_decimals,
         dai_token_address,
@@ -2222,13 +1305,10 @@ def test_vesting_claim_purchase(
 
     # Move Chain Forward ##
 
-    unix_seconds_in_a_day = 86399
     days = 375
-    unix_time_elapsed = int(unix_seconds_in_a_day * days)
-
-    unix_time_at_end_of_vesting = int(start_time + unix_time_elapsed)
 
-    chain.mine(1, unix_time_at_end_of_vesting)
+    chain.sleep(SECONDS_PER_DAY * days)
+    chain.mine()
 
     ## Test Actions ##
 
@@ -2247,57 +1327,36 @@ def test_vesting_claim_purchase(
     )
 
     assert (
-        account_claim_transaction.events[0]["to"] == dai_whale_address
+        account_claim_transaction.events["Transfer"]["to"] == dai_whale_address
     ), "Vesting claim was not transferred to vestor"
 
     with capsys.disabled():
-        print(purchase_tx.info())
+        verbose(purchase_tx.info)
         print(account_vesting_schedule)
-        print(account_claim_transaction.info())
+        verbose(account_claim_transaction.info)
         print(dai_whale_address)
 
 
 # Cancel individual vesting schedule after 3 months (multisig only)
-def test_vesting_cancellation(vesting_manager, main, capsys, chain):
+def test_vesting_cancellation(
+    standard_vesting_parameters,
+    funded_manager,
+    main,
+    eefi_contract,
+    eefi_whale,
+    verbose,
+    capsys,
+    chain,
+):
     # ## Test Setup ##
 
     # Contracts #
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
-    asset_address = eefi_contract.address
-    is_fixed = False
-    cliff_weeks = 52  # 1 year
-    vesting_weeks = 55  # Vesting occurs over 3 weeks post-cliff
-    start_time = time.time()  # Current time in UNIX
-
-    vesting_params_list = [
-        asset_address,
-        is_fixed,
-        cliff_weeks,
-        vesting_weeks,
-        start_time,
-    ]
+    vesting_params_list = standard_vesting_parameters
 
     # Vest Tokens ##
 
@@ -2314,13 +1373,10 @@ def test_vesting_cancellation(vesting_manager, main, capsys, chain):
 
     ## Move Chain Forward ##
 
-    unix_seconds_in_a_day = 86399
     days = 95
-    unix_time_elapsed = int(unix_seconds_in_a_day * days)
-
-    unix_time_at_end_of_vesting = int(start_time + unix_time_elapsed)
 
-    chain.mine(1, unix_time_at_end_of_vesting)
+    chain.sleep(SECONDS_PER_DAY * days)
+    chain.mine()
 
     ## Test Actions ##
 
@@ -2333,11 +1389,11 @@ def test_vesting_cancellation(vesting_manager, main, capsys, chain):
     )
 
     assert (
-        cancel_vesting_for_user.events[0]["value"] == eefi_vesting_amount
+        cancel_vesting_for_user.events["Transfer"]["value"] == eefi_vesting_amount
     ), "Vesting was not cancelled"
 
     with capsys.disabled():
-        print(cancel_vesting_for_user.info())
+        verbose(cancel_vesting_for_user.info)
 
 
 ##### ----- Views  ----- #####
@@ -2345,7 +1401,12 @@ def test_vesting_cancellation(vesting_manager, main, capsys, chain):
 
 # View global locked token amount
 def test_view_locked_token_amount(
-    set_vesting_token, standard_vesting_parameters, vesting_manager, main, capsys
+    set_vesting_token,
+    standard_vesting_parameters,
+    funded_manager,
+    main,
+    eefi_contract,
+    capsys,
 ):
     # ## Test Setup ##
 
@@ -2353,24 +1414,6 @@ def test_view_locked_token_amount(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
     vesting_params_list = standard_vesting_parameters
@@ -2404,31 +1447,18 @@ def test_view_locked_token_amount(
 
 # View indiviudal vesting schedule
 def test_view_individual_vesting_schedule(
-    standard_vesting_parameters, vesting_manager, main, capsys, chain
+    standard_vesting_parameters,
+    funded_manager,
+    main,
+    eefi_contract,
+    capsys,
+    chain,
 ):
     # ## Test Setup ##
 
     # Contracts #
 
-    vesting_executor = main
-
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
+    vesting_executor = main
 
     # Set up Vesting Parameters #
 
@@ -2467,7 +1497,7 @@ def test_view_individual_vesting_schedule(
 
 # #Can't vest more tokens than in the contract (locked + unlocked quantities)
 def test_standard_vesting_token_runs_out(
-    standard_vesting_parameters, vesting_manager, main, capsys
+    standard_vesting_parameters, funded_manager, main, eefi_contract, verbose, capsys
 ):
     # ## Test Setup ##
 
@@ -2475,24 +1505,6 @@ def test_standard_vesting_token_runs_out(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
     vesting_params_list = standard_vesting_parameters
@@ -2521,11 +1533,11 @@ def test_standard_vesting_token_runs_out(
             vestor_address,
             eefi_vesting_amount,
             vesting_params_list,
-            {"from": accounts[1]},
+            {"from": accounts[1], "gas_limit": 500000, "allow_revert": True},
         )
 
     with capsys.disabled():
-        print(standard_vesting_transaction.info())
+        verbose(standard_vesting_transaction.info)
         print(
             "Transaction should fail because total vested amount requests exceed contract balance (locked and unlocked tokens)"
         )
@@ -2533,7 +1545,15 @@ def test_standard_vesting_token_runs_out(
 
 # Can't purchase vesting asset with non-approved token
 def test_purchase_vesting_token_non_approved_token(
-    set_vesting_token, standard_vesting_parameters, vesting_manager, main, capsys
+    set_vesting_token,
+    standard_vesting_parameters,
+    approvals,
+    funded_manager,
+    main,
+    eefi_contract,
+    lusd_contract,
+    lusd_whale,
+    capsys,
 ):
     # ## Test Setup ##
 
@@ -2541,52 +1561,14 @@ def test_purchase_vesting_token_non_approved_token(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    lusd_contract = Contract("0x5f98805A4E8be255a32880FDeC7F6728C6568bA0")
-
     lusd_token_address = lusd_contract.address
 
-    lusd_whale = accounts.at("0x833642ED556a8a41D5fd5729D9fED774A039f13c", force=True)
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Set Threshold and Release Percentage #
-
-    purchase_amount_threshold = 3000
-
-    vesting_executor.setPurchaseAmountThreshold(
-        purchase_amount_threshold, {"from": accounts[1]}
-    )  # Set threshold
-
-    release_percentage = 2 * 10**4
-
-    vesting_executor.setReleasePercentage(
-        release_percentage, {"from": accounts[1]}
-    )  # Set release percentage
-
-    lusd_approval = 500000 * 10**18
-
     desired_eefi_amount = 300
 
     vesting_token_price = 12
 
     purchase_amount = (desired_eefi_amount * vesting_token_price) * 10**18
 
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
     vesting_params_list = standard_vesting_parameters
@@ -2601,17 +1583,13 @@ def test_purchase_vesting_token_non_approved_token(
 
     ## Test Actions ##
 
-    lusd_approval_tx = lusd_contract.approve(
-        vesting_executor_address, lusd_approval, {"from": lusd_whale}
-    )
-
     with brownie.reverts("Exchange token must be a valid approved token"):
         purchase_tx = vesting_executor.purchaseVestingToken(
             desired_eefi_amount * eefi_token_decimals,
             lusd_token_address,
             eefi_contract.address,
             vesting_params_list,
-            {"from": lusd_whale},
+            {"from": lusd_whale, "gas_limit": 500000, "allow_revert": True},
         )
 
     with capsys.disabled():
@@ -2620,7 +1598,7 @@ def test_purchase_vesting_token_non_approved_token(
 
 # Can't vest when standard vesting is paused.
 def test_vesting_when_paused(
-    standard_vesting_parameters, vesting_manager, main, capsys
+    standard_vesting_parameters, funded_manager, main, eefi_contract, capsys
 ):
     # ## Test Setup ##
 
@@ -2628,24 +1606,6 @@ def test_vesting_when_paused(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
     vesting_params_list = standard_vesting_parameters
@@ -2669,7 +1629,7 @@ def test_vesting_when_paused(
             vestor_address,
             eefi_vesting_amount,
             vesting_params_list,
-            {"from": accounts[1]},
+            {"from": accounts[1], "gas_limit": 500000, "allow_revert": True},
         )
 
     with capsys.disabled():
@@ -2678,7 +1638,15 @@ def test_vesting_when_paused(
 
 # Can't purchase and vest when vesting is paused
 def test_purchase_vesting_paused(
-    set_vesting_token, standard_vesting_parameters, vesting_manager, main, capsys
+    set_vesting_token,
+    standard_vesting_parameters,
+    approvals,
+    funded_manager,
+    main,
+    eefi_contract,
+    dai_contract,
+    dai_whale,
+    capsys,
 ):
     # ## Test Setup ##
 
@@ -2686,54 +1654,16 @@ def test_purchase_vesting_paused(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    dai_contract = Contract("0x6B175474E89094C44Da98b954EedeAC495271d0F")
-
     dai_token_address = dai_contract.address
 
-    dai_whale = accounts.at("0x748dE14197922c4Ae258c7939C7739f3ff1db573", force=True)
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Set Threshold and Release Percentage #
-
-    purchase_amount_threshold = 3000
-
-    vesting_executor.setPurchaseAmountThreshold(
-        purchase_amount_threshold, {"from": accounts[1]}
-    )  # Set threshold
-
-    release_percentage = 2 * 10**4
-
-    vesting_executor.setReleasePercentage(
-        release_percentage, {"from": accounts[1]}
-    )  # Set release percentage
-
     # Vesting Token Pricing #
 
-    dai_approval = 500000 * 10**18
-
     desired_eefi_amount = 300
 
     vesting_token_price = 12
 
     purchase_amount = (desired_eefi_amount * vesting_token_price) * 10**18
 
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
     vesting_params_list = standard_vesting_parameters
@@ -2752,17 +1682,13 @@ def test_purchase_vesting_paused(
 
     ## Test Actions ##
 
-    dai_approval_tx = dai_contract.approve(
-        vesting_executor_address, dai_approval, {"from": dai_whale}
-    )
-
     with brownie.reverts("Vesting not active"):
         purchase_tx = vesting_executor.purchaseVestingToken(
             desired_eefi_amount * 10**18,
             dai_token_address,
             eefi_contract.address,
             vesting_params_list,
-            {"from": dai_whale},
+            {"from": dai_whale, "gas_limit": 500000, "allow_revert": True},
         )
 
     with capsys.disabled():
@@ -2770,46 +1696,25 @@ def test_purchase_vesting_paused(
 
 
 # Can't swap when swapping is paused.
-def test_swap_and_vest_when_paused(vesting_manager, main, capsys, chain):
+def test_swap_and_vest_when_paused(
+    approvals,
+    standard_vesting_parameters,
+    funded_manager,
+    main,
+    eefi_contract,
+    eefi_whale,
+    capsys,
+    chain,
+):
     ## Test Setup ##
 
     # Contracts #
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
-    asset_address = eefi_contract.address
-    is_fixed = False
-    cliff_weeks = 52  # 1 year
-    vesting_weeks = 55  # Vesting occurs over 3 weeks post-cliff
-    start_time = time.time()  # Current time in UNIX
-
-    vesting_params_list = [
-        asset_address,
-        is_fixed,
-        cliff_weeks,
-        vesting_weeks,
-        start_time,
-    ]
+    vesting_params_list = standard_vesting_parameters
 
     ## Test Actions ##
 
@@ -2821,8 +1726,6 @@ def test_swap_and_vest_when_paused(vesting_manager, main, capsys, chain):
 
     vesting_executor.setSwapRatio(swap_ratio_scaled, {"from": accounts[1]})
 
-    contract_swap_ratio = vesting_executor.swapRatio()
-
     # Add Authorized Swap Token
 
     swap_token_address = eefi_contract.address
@@ -2833,8 +1736,6 @@ def test_swap_and_vest_when_paused(vesting_manager, main, capsys, chain):
         swap_token_address, swap_token_decimals, {"from": accounts[1]}
     )
 
-    swap_token_details = vesting_executor.authorizedSwapTokens(swap_token_address)
-
     # Swap Transaction
 
     swap_token_amount = 100 * 10**18
@@ -2845,18 +1746,12 @@ def test_swap_and_vest_when_paused(vesting_manager, main, capsys, chain):
 
     token_to_swap = eefi_contract.address
 
-    eefi_approval = 200 * 10**18
-
-    eefi_approval_tx = eefi_contract.approve(
-        vesting_executor_address, eefi_approval, {"from": eefi_whale}
-    )
-
     with brownie.reverts("Swapping not active"):
         swap_and_vest_transaction = vesting_executor.swapAndVest(
             swap_token_amount_scaled,
             token_to_swap,
             vesting_params_list,
-            {"from": eefi_whale},
+            {"from": eefi_whale, "gas_limit": 500000, "allow_revert": True},
         )
 
     with capsys.disabled():
@@ -2865,245 +1760,14 @@ def test_swap_and_vest_when_paused(vesting_manager, main, capsys, chain):
 
 # #Can't swap with unapproved swapping asset
 def test_swap_and_vest_with_non_approved_asset(
-    standard_vesting_parameters, vesting_manager, main, capsys, chain
-):
-    ## Test Setup ##
-
-    # Contracts #
-
-    vesting_executor = main
-
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
-    # Set up Vesting Parameters #
-
-    vesting_params_list = standard_vesting_parameters
-
-    # Swap Status
-
-    swap_status = 0  # Active
-
-    vesting_executor.setSwappingStatus(swap_status, {"from": accounts[1]})  # Set status
-
-    # Swap Ratio
-
-    swap_ratio = 0.25
-
-    swap_ratio_scaled = 0.25 * 10**4
-
-    vesting_executor.setSwapRatio(swap_ratio_scaled, {"from": accounts[1]})
-
-    contract_swap_ratio = vesting_executor.swapRatio()
-
-    # Swap Transaction
-
-    swap_token_amount = 100
-
-    swap_token_decimals = 10**18
-
-    swap_token_amount_scaled = swap_token_amount * swap_token_decimals
-
-    token_to_swap = eefi_contract.address
-
-    eefi_approval = 200 * 10**18
-
-    eefi_approval_tx = eefi_contract.approve(
-        vesting_executor_address, eefi_approval, {"from": eefi_whale}
-    )
-
-    ## Test Actions ##
-
-    with brownie.reverts("Token must be authorized swap token"):
-        swap_and_vest_transaction = vesting_executor.swapAndVest(
-            swap_token_amount_scaled,
-            token_to_swap,
-            vesting_params_list,
-            {"from": eefi_whale},
-        )
-
-    with capsys.disabled():
-        print("Swap transaction should fail because swap token is not authorized.")
-
-
-# Can't vest with incorrect vesting parameters
-def test_standard_vesting_incorrect_parameters(vesting_manager, main, capsys):
-    # ## Test Setup ##
-
-    # Contracts #
-
-    vesting_executor = main
-
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
-    # Set up Invalid Vesting Parameters (Standard Vesting) #
-
-    asset_address = eefi_contract.address
-    is_fixed = False
-    cliff_weeks = 52  # 1 year
-    vesting_weeks = 50  # Vesting is less than cliff
-    start_time = time.time()  # Current time in UNIX
-
-    vesting_params_list = [
-        asset_address,
-        is_fixed,
-        cliff_weeks,
-        vesting_weeks,
-        start_time,
-    ]
-
-    ## Test Actions ##
-
-    vestor_address = accounts[0].address
-
-    eefi_vesting_amount = 2500 * 10**18
-
-    with brownie.reverts("Vesting: invalid vesting params set"):
-        standard_vesting_transaction = vesting_executor.standardVesting(
-            vestor_address,
-            eefi_vesting_amount,
-            vesting_params_list,
-            {"from": accounts[1]},
-        )
-
-    with capsys.disabled():
-        print("Transaction should fail because vesting parameters are not correct.")
-
-
-# #Can't swap with invalid vesting parameters (start time)
-def test_swap_and_vest_with_wrong_start_time(
-    valid_vesting_parameters, vesting_manager, main, capsys, chain
-):
-    ## Test Setup ##
-
-    # Contracts #
-
-    vesting_executor = main
-
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
-    # Set up Invalid Vesting Parameters (Wrong Start Time) #
-
-    asset_address = eefi_contract.address
-    is_fixed = False
-    cliff_weeks = 52  # 1 year
-    vesting_weeks = 50  # Vesting is less than cliff
-    start_time = time.time() - 30 * 60  # Current time in UNIX 30 minutes ago
-
-    vesting_params_list = [
-        asset_address,
-        is_fixed,
-        cliff_weeks,
-        vesting_weeks,
-        start_time,
-    ]
-
-    # Swap Status
-
-    swap_status = 0  # Active
-
-    vesting_executor.setSwappingStatus(swap_status, {"from": accounts[1]})  # Set status
-
-    # Swap Ratio
-
-    swap_ratio = 0.25
-
-    swap_ratio_scaled = 0.25 * 10**4
-
-    vesting_executor.setSwapRatio(swap_ratio_scaled, {"from": accounts[1]})
-
-    contract_swap_ratio = vesting_executor.swapRatio()
-
-    # Add Authorized Swap Token
-
-    swap_token_address = eefi_contract.address
-
-    swap_token_decimals = 10**18
-
-    set_swap_token = vesting_executor.addAuthorizedSwapToken(
-        swap_token_address, swap_token_decimals, {"from": accounts[1]}
-    )
-
-    # Swap Transaction
-
-    swap_token_amount = 100
-
-    swap_token_decimals = 10**18
-
-    swap_token_amount_scaled = swap_token_amount * swap_token_decimals
-
-    token_to_swap = eefi_contract.address
-
-    eefi_approval = 200 * 10**18
-
-    eefi_approval_tx = eefi_contract.approve(
-        vesting_executor_address, eefi_approval, {"from": eefi_whale}
-    )
-
-    ## Test Actions ##
-
-    with brownie.reverts("Vesting: not valid parameters"):
-        swap_and_vest_transaction = vesting_executor.swapAndVest(
-            swap_token_amount_scaled,
-            token_to_swap,
-            vesting_params_list,
-            {"from": eefi_whale},
-        )
-
-    with capsys.disabled():
-        print("Swap transaction should fail because start time is not valid.")
-
-
-# Can't swap with invalid vesting parameters (cliff and vesting)
-def test_swap_and_vest_with_wrong_cliff_and_vesting(
-    valid_vesting_parameters, vesting_manager, main, capsys, chain
+    standard_vesting_parameters,
+    approvals,
+    funded_manager,
+    main,
+    eefi_contract,
+    eefi_whale,
+    capsys,
+    chain,
 ):
     ## Test Setup ##
 
@@ -3111,41 +1775,9 @@ def test_swap_and_vest_with_wrong_cliff_and_vesting(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    dai_contract = Contract("0x6B175474E89094C44Da98b954EedeAC495271d0F")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
-    # Set up Invalid Vesting Parameters (Wrong Cliff and vesting period) #
-
-    asset_address = eefi_contract.address
-    is_fixed = False
-    cliff_weeks = 2  # 1 year
-    vesting_weeks = 10
-    start_time = time.time()  # Current time in UNIX
+    # Set up Vesting Parameters #
 
-    vesting_params_list = [
-        asset_address,
-        is_fixed,
-        cliff_weeks,
-        vesting_weeks,
-        start_time,
-    ]
+    vesting_params_list = standard_vesting_parameters
 
     # Swap Status
 
@@ -3153,16 +1785,6 @@ def test_swap_and_vest_with_wrong_cliff_and_vesting(
 
     vesting_executor.setSwappingStatus(swap_status, {"from": accounts[1]})  # Set status
 
-    # Add Authorized Swap Token
-
-    swap_token_address = eefi_contract.address
-
-    swap_token_decimals = 10**18
-
-    set_swap_token = vesting_executor.addAuthorizedSwapToken(
-        swap_token_address, swap_token_decimals, {"from": accounts[1]}
-    )
-
     # Swap Ratio
 
     swap_ratio = 0.25
@@ -3171,8 +1793,6 @@ def test_swap_and_vest_with_wrong_cliff_and_vesting(
 
     vesting_executor.setSwapRatio(swap_ratio_scaled, {"from": accounts[1]})
 
-    contract_swap_ratio = vesting_executor.swapRatio()
-
     # Swap Transaction
 
     swap_token_amount = 100
@@ -3183,29 +1803,28 @@ def test_swap_and_vest_with_wrong_cliff_and_vesting(
 
     token_to_swap = eefi_contract.address
 
-    eefi_approval = 200 * 10**18
-
-    eefi_approval_tx = eefi_contract.approve(
-        vesting_executor_address, eefi_approval, {"from": eefi_whale}
-    )
-
     ## Test Actions ##
 
-    with brownie.reverts("Vesting: not valid parameters"):
+    with brownie.reverts("Token must be authorized swap token"):
         swap_and_vest_transaction = vesting_executor.swapAndVest(
             swap_token_amount_scaled,
             token_to_swap,
             vesting_params_list,
-            {"from": eefi_whale},
+            {"from": eefi_whale, "gas_limit": 500000, "allow_revert": True},
         )
 
     with capsys.disabled():
-        print("Swap transaction should fail because cliff and vesting are not valid.")
+        print("Swap transaction should fail because swap token is not authorized.")
 
 
-# Can't purchase if start time is incorrect
-def test_purchase_vesting_start_time_incorrect(
-    set_vesting_token, valid_vesting_parameters, vesting_manager, main, capsys
+# Can't vest with incorrect vesting parameters
+def test_standard_vesting_incorrect_parameters(
+    make_vesting_parameters,
+    funded_manager,
+    main,
+    eefi_contract,
+    capsys,
+    chain,
 ):
     # ## Test Setup ##
 
@@ -3213,98 +1832,140 @@ def test_purchase_vesting_start_time_incorrect(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
+    # Set up Invalid Vesting Parameters (Standard Vesting) #
 
-    dai_contract = Contract("0x6B175474E89094C44Da98b954EedeAC495271d0F")
+    # Vesting is less than cliff
+    vesting_params_list = make_vesting_parameters(cliff_weeks=52, vesting_weeks=50)
 
-    dai_token_address = dai_contract.address
+    ## Test Actions ##
 
-    dai_whale = accounts.at("0x748dE14197922c4Ae258c7939C7739f3ff1db573", force=True)
+    vestor_address = accounts[0].address
 
-    vesting_executor_address = vesting_executor.address
+    eefi_vesting_amount = 2500 * 10**18
 
-    vesting_manager_address = vesting_manager
+    with brownie.reverts("Vesting: invalid vesting params set"):
+        standard_vesting_transaction = vesting_executor.standardVesting(
+            vestor_address,
+            eefi_vesting_amount,
+            vesting_params_list,
+            {"from": accounts[1], "gas_limit": 500000, "allow_revert": True},
+        )
 
-    # Set Threshold and Release Percentage #
+    with capsys.disabled():
+        print("Transaction should fail because vesting parameters are not correct.")
 
-    purchase_amount_threshold = 3000
 
-    vesting_executor.setPurchaseAmountThreshold(
-        purchase_amount_threshold, {"from": accounts[1]}
-    )  # Set threshold
+# #Can't swap with invalid vesting parameters (cliff, vesting and start time)
+@pytest.mark.parametrize(
+    "cliff_weeks, vesting_weeks, start_offset, revert_msg",
+    [
+        (52, 50, 0, "Vesting: not valid parameters"),  # Vesting shorter than cliff
+        (2, 10, 0, "Vesting: not valid parameters"),  # Below the swap minimums
+        (52, 88, 90 * 60, "Invalid start time set"),  # Start over 60 minutes ago
+    ],
+    ids=["cliff_longer_than_vesting", "below_minimum_weeks", "start_time_too_early"],
+)
+def test_swap_and_vest_with_wrong_parameters(
+    valid_vesting_parameters,
+    make_vesting_parameters,
+    approvals,
+    funded_manager,
+    main,
+    eefi_contract,
+    eefi_whale,
+    cliff_weeks,
+    vesting_weeks,
+    start_offset,
+    revert_msg,
+    capsys,
+    chain,
+):
+    ## Test Setup ##
 
-    release_percentage = 2 * 10**4
+    # Contracts #
 
-    vesting_executor.setReleasePercentage(
-        release_percentage, {"from": accounts[1]}
-    )  # Set release percentage
+    vesting_executor = main
 
-    # Vesting Token Pricing #
+    # Set up Invalid Vesting Parameters #
 
-    dai_approval = 500000 * 10**18
+    vesting_params_list = make_vesting_parameters(
+        cliff_weeks, vesting_weeks, start_offset=start_offset
+    )
 
-    desired_eefi_amount = 300
+    # Swap Status
 
-    vesting_token_price = 12
+    swap_status = 0  # Active
 
-    purchase_amount = (desired_eefi_amount * vesting_token_price) * 10**18
+    vesting_executor.setSwappingStatus(swap_status, {"from": accounts[1]})  # Set status
 
-    # Transfer EEFI #
+    # Swap Ratio
 
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
+    swap_ratio = 0.25
 
-    transfer_amount = 5000 * 10**18
+    swap_ratio_scaled = 0.25 * 10**4
 
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
+    vesting_executor.setSwapRatio(swap_ratio_scaled, {"from": accounts[1]})
 
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
+    # Add Authorized Swap Token
 
-    # Set up Vesting Parameters #
+    swap_token_address = eefi_contract.address
 
-    # Set up Invalid Vesting Parameters (Wrong Start Time) #
+    swap_token_decimals = 10**18
 
-    asset_address = eefi_contract.address
-    is_fixed = False
-    cliff_weeks = 52  # 1 year
-    vesting_weeks = 50  # Vesting is less than cliff
-    start_time = time.time() - 30 * 60  # Current time in UNIX 30 minutes ago
+    set_swap_token = vesting_executor.addAuthorizedSwapToken(
+        swap_token_address, swap_token_decimals, {"from": accounts[1]}
+    )
 
-    vesting_params_list = [
-        asset_address,
-        is_fixed,
-        cliff_weeks,
-        vesting_weeks,
-        start_time,
-    ]
+    # Swap Transaction
 
-    # Set Vesting Token
+    swap_token_amount = 100
 
-    set_vesting_token = set_vesting_token
+    swap_token_decimals = 10**18
 
-    ## Test Actions ##
+    swap_token_amount_scaled = swap_token_amount * swap_token_decimals
 
-    dai_approval_tx = dai_contract.approve(
-        vesting_executor_address, dai_approval, {"from": dai_whale}
-    )
+    token_to_swap = eefi_contract.address
 
-    with brownie.reverts("Vesting: invalid vesting params set"):
-        purchase_tx = vesting_executor.purchaseVestingToken(
-            desired_eefi_amount * 10**18,
-            dai_token_address,
-            eefi_contract.address,
+    ## Test Actions ##
+
+    with brownie.reverts(revert_msg):
+        swap_and_vest_transaction = vesting_executor.swapAndVest(
+            swap_token_amount_scaled,
+            token_to_swap,
             vesting_params_list,
-            {"from": dai_whale},
+            {"from": eefi_whale, "gas_limit": 500000, "allow_revert": True},
         )
 
     with capsys.disabled():
-        print(("Vesting should fail because start time is incorrect."))
-
-
-# Can't purchase if cliff and vesting are incorrect
-def test_purchase_vesting_cliff_vesting_incorrect(
-    set_vesting_token, valid_vesting_parameters, vesting_manager, main, capsys
+        print("Swap transaction should fail because vesting parameters are not valid.")
+
+
+# Can't purchase if cliff, vesting or start time are incorrect
+@pytest.mark.parametrize(
+    "cliff_weeks, vesting_weeks, start_offset, revert_msg",
+    [
+        (52, 50, 0, "Vesting: invalid vesting params set"),  # Vesting shorter than cliff
+        (18, 20, 0, "Vesting: invalid vesting params set"),  # Below the purchase minimums
+        (52, 55, 90 * 60, "Invalid start time set"),  # Start over 60 minutes ago
+    ],
+    ids=["cliff_longer_than_vesting", "below_minimum_weeks", "start_time_too_early"],
+)
+def test_purchase_vesting_parameters_incorrect(
+    set_vesting_token,
+    valid_vesting_parameters,
+    make_vesting_parameters,
+    approvals,
+    funded_manager,
+    main,
+    eefi_contract,
+    dai_contract,
+    dai_whale,
+    cliff_weeks,
+    vesting_weeks,
+    start_offset,
+    revert_msg,
+    chain,
+    capsys,
 ):
     # ## Test Setup ##
 
@@ -3312,136 +1973,55 @@ def test_purchase_vesting_cliff_vesting_incorrect(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    dai_contract = Contract("0x6B175474E89094C44Da98b954EedeAC495271d0F")
-
     dai_token_address = dai_contract.address
 
-    dai_whale = accounts.at("0x748dE14197922c4Ae258c7939C7739f3ff1db573", force=True)
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Set Threshold and Release Percentage #
-
-    purchase_amount_threshold = 3000
-
-    vesting_executor.setPurchaseAmountThreshold(
-        purchase_amount_threshold, {"from": accounts[1]}
-    )  # Set threshold
-
-    release_percentage = 2 * 10**4
-
-    vesting_executor.setReleasePercentage(
-        release_percentage, {"from": accounts[1]}
-    )  # Set release percentage
-
     # Vesting Token Pricing #
 
-    dai_approval = 500000 * 10**18
-
     desired_eefi_amount = 300
 
-    vesting_token_price = 12
-
-    purchase_amount = (desired_eefi_amount * vesting_token_price) * 10**18
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
+    # Set up Invalid Vesting Parameters #
 
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
+    vesting_params_list = make_vesting_parameters(
+        cliff_weeks, vesting_weeks, start_offset=start_offset
     )
 
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
-    # Set up Vesting Parameters #
-
-    # Set up Invalid Vesting Parameters (Wrong Start Time) #
-
-    asset_address = eefi_contract.address
-    is_fixed = False
-    cliff_weeks = 18  # 1 year
-    vesting_weeks = 20  # Vesting is less than cliff
-    start_time = time.time()  # Current time in UNIX 30 minutes ago
-
-    vesting_params_list = [
-        asset_address,
-        is_fixed,
-        cliff_weeks,
-        vesting_weeks,
-        start_time,
-    ]
-
     # Set Vesting Token
 
     set_vesting_token = set_vesting_token
 
     ## Test Actions ##
 
-    dai_approval_tx = dai_contract.approve(
-        vesting_executor_address, dai_approval, {"from": dai_whale}
-    )
-
-    with brownie.reverts("Vesting: invalid vesting params set"):
+    with brownie.reverts(revert_msg):
         purchase_tx = vesting_executor.purchaseVestingToken(
             desired_eefi_amount * 10**18,
             dai_token_address,
             eefi_contract.address,
             vesting_params_list,
-            {"from": dai_whale},
+            {"from": dai_whale, "gas_limit": 500000, "allow_revert": True},
         )
 
     with capsys.disabled():
-        print(("Vesting should fail because cliff and vesting are incorrect."))
+        print("Vesting should fail because vesting parameters are incorrect.")
 
 
 # Can't claim asset during cliff period
-def test_vesting_claim_standard_before_cliff_end(vesting_manager, main, capsys, chain):
+def test_vesting_claim_standard_before_cliff_end(
+    standard_vesting_parameters,
+    funded_manager,
+    main,
+    eefi_contract,
+    capsys,
+    chain,
+):
     # ## Test Setup ##
 
     # Contracts #
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
-    asset_address = eefi_contract.address
-    is_fixed = False
-    cliff_weeks = 52  # 1 year
-    vesting_weeks = 55  # Vesting occurs over 3 weeks post-cliff
-    start_time = time.time()  # Current time in UNIX
-
-    vesting_params_list = [
-        asset_address,
-        is_fixed,
-        cliff_weeks,
-        vesting_weeks,
-        start_time,
-    ]
+    vesting_params_list = standard_vesting_parameters
 
     # Vest Tokens #
 
@@ -3458,13 +2038,10 @@ def test_vesting_claim_standard_before_cliff_end(vesting_manager, main, capsys,
 
     # Move Chain Forward (Less than 1 year) ##
 
-    unix_seconds_in_a_day = 86399
     days = 275
-    unix_time_elapsed = int(unix_seconds_in_a_day * days)
-
-    unix_time_at_end_of_vesting = int(start_time + unix_time_elapsed)
 
-    chain.mine(1, unix_time_at_end_of_vesting)
+    chain.sleep(SECONDS_PER_DAY * days)
+    chain.mine()
 
     ## Test Actions ##
 
@@ -3479,7 +2056,7 @@ def test_vesting_claim_standard_before_cliff_end(vesting_manager, main, capsys,
             account_vesting_number,
             vestor_address,
             eefi_contract.address,
-            {"from": accounts[0]},
+            {"from": accounts[0], "gas_limit": 500000, "allow_revert": True},
         )
 
     with capsys.disabled():
@@ -3487,52 +2064,31 @@ def test_vesting_claim_standard_before_cliff_end(vesting_manager, main, capsys,
 
 
 # Can't withdraw locked tokens
-def test_vesting_cant_withdraw_locked_tokens(vesting_manager, main, capsys, chain):
+def test_vesting_cant_withdraw_locked_tokens(
+    standard_vesting_parameters,
+    funded_manager,
+    main,
+    eefi_contract,
+    eefi_whale,
+    transfer_amount,
+    capsys,
+    chain,
+):
     # ## Test Setup ##
 
     # Contracts #
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 2000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
-    asset_address = eefi_contract.address
-    is_fixed = False
-    cliff_weeks = 52  # 1 year
-    vesting_weeks = 55  # Vesting occurs over 3 weeks post-cliff
-    start_time = time.time()  # Current time in UNIX
-
-    vesting_params_list = [
-        asset_address,
-        is_fixed,
-        cliff_weeks,
-        vesting_weeks,
-        start_time,
-    ]
+    vesting_params_list = standard_vesting_parameters
 
     # Vest Tokens #
 
     vestor_address = accounts[0].address
 
-    eefi_vesting_amount = 2000 * 10**18  # Lock all tokens
+    eefi_vesting_amount = transfer_amount  # Lock all tokens
 
     standard_vesting_transaction = vesting_executor.standardVesting(
         vestor_address,
@@ -3543,13 +2099,10 @@ def test_vesting_cant_withdraw_locked_tokens(vesting_manager, main, capsys, chai
 
     # Move Chain Forward (Less than 1 year) ##
 
-    unix_seconds_in_a_day = 86399
     days = 275
-    unix_time_elapsed = int(unix_seconds_in_a_day * days)
-
-    unix_time_at_end_of_vesting = int(start_time + unix_time_elapsed)
 
-    chain.mine(1, unix_time_at_end_of_vesting)
+    chain.sleep(SECONDS_PER_DAY * days)
+    chain.mine()
 
     ## Test Actions ##
 
@@ -3557,7 +2110,9 @@ def test_vesting_cant_withdraw_locked_tokens(vesting_manager, main, capsys, chai
 
     with brownie.reverts("Vesting: Can't withdraw"):
         withdrawal_tx = vesting_executor.withdrawVestingTokens(
-            withdraw_amount, eefi_contract.address, {"from": eefi_whale}
+            withdraw_amount,
+            eefi_contract.address,
+            {"from": eefi_whale, "gas_limit": 500000, "allow_revert": True},
         )
 
     with capsys.disabled():
@@ -3565,46 +2120,25 @@ def test_vesting_cant_withdraw_locked_tokens(vesting_manager, main, capsys, chai
 
 
 # Can't cancel fixed vesting schedule
-def test_vesting_cancellation_fixed_decline(vesting_manager, main, capsys, chain):
+def test_vesting_cancellation_fixed_decline(
+    make_vesting_parameters,
+    funded_manager,
+    main,
+    eefi_contract,
+    eefi_whale,
+    capsys,
+    chain,
+):
     # ## Test Setup ##
 
     # Contracts #
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
-    asset_address = eefi_contract.address
-    is_fixed = True  # Vesting schedule can't be changed
-    cliff_weeks = 52  # 1 year
-    vesting_weeks = 55  # Vesting occurs over 3 weeks post-cliff
-    start_time = time.time()  # Current time in UNIX
-
-    vesting_params_list = [
-        asset_address,
-        is_fixed,
-        cliff_weeks,
-        vesting_weeks,
-        start_time,
-    ]
+    # Vesting schedule can't be changed
+    vesting_params_list = make_vesting_parameters(is_fixed=True)
 
     # Vest Tokens ##
 
@@ -3621,13 +2155,10 @@ def test_vesting_cancellation_fixed_decline(vesting_manager, main, capsys, chain
 
     ## Move Chain Forward ##
 
-    unix_seconds_in_a_day = 86399
     days = 95
-    unix_time_elapsed = int(unix_seconds_in_a_day * days)
-
-    unix_time_at_end_of_vesting = int(start_time + unix_time_elapsed)
 
-    chain.mine(1, unix_time_at_end_of_vesting)
+    chain.sleep(SECONDS_PER_DAY * days)
+    chain.mine()
 
     ## Test Actions ##
 
@@ -3637,7 +2168,9 @@ def test_vesting_cancellation_fixed_decline(vesting_manager, main, capsys, chain
 
     with brownie.reverts("Vesting: Account is fixed"):
         cancel_vesting_for_user = vesting_executor.cancelVesting(
-            vestor_address, account_vesting_number, {"from": eefi_whale}
+            vestor_address,
+            account_vesting_number,
+            {"from": eefi_whale, "gas_limit": 500000, "allow_revert": True},
         )
 
     with capsys.disabled():
@@ -3646,7 +2179,12 @@ def test_vesting_cancellation_fixed_decline(vesting_manager, main, capsys, chain
 
 # Account can't claim another's vesting tokens
 def test_vesting_claim_standard_non_vesting_account(
-    vesting_manager, main, capsys, chain
+    standard_vesting_parameters,
+    funded_manager,
+    main,
+    eefi_contract,
+    capsys,
+    chain,
 ):
     # ## Test Setup ##
 
@@ -3654,39 +2192,9 @@ def test_vesting_claim_standard_non_vesting_account(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
-    asset_address = eefi_contract.address
-    is_fixed = False
-    cliff_weeks = 52  # 1 year
-    vesting_weeks = 55  # Vesting occurs over 3 weeks post-cliff
-    start_time = time.time()  # Current time in UNIX
-
-    vesting_params_list = [
-        asset_address,
-        is_fixed,
-        cliff_weeks,
-        vesting_weeks,
-        start_time,
-    ]
+    vesting_params_list = standard_vesting_parameters
 
     # Vest Tokens #
 
@@ -3703,13 +2211,10 @@ def test_vesting_claim_standard_non_vesting_account(
 
     # Move Chain Forward (1 year) ##
 
-    unix_seconds_in_a_day = 86399
     days = 370
-    unix_time_elapsed = int(unix_seconds_in_a_day * days)
 
-    unix_time_at_end_of_vesting = int(start_time + unix_time_elapsed)
-
-    chain.mine(1, unix_time_at_end_of_vesting)
+    chain.sleep(SECONDS_PER_DAY * days)
+    chain.mine()
 
     ## Test Actions ##
 
@@ -3726,7 +2231,7 @@ def test_vesting_claim_standard_non_vesting_account(
             account_vesting_number,
             non_vesting_address,
             eefi_contract.address,
-            {"from": accounts[0]},
+            {"from": accounts[0], "gas_limit": 500000, "allow_revert": True},
         )
 
     with capsys.disabled():
@@ -3740,7 +2245,16 @@ def test_vesting_claim_standard_non_vesting_account(
 
 # Purchase fractions of vesting asset
 def test_purchase_vesting_token_dai_fraction(
-    set_vesting_token, standard_vesting_parameters, vesting_manager, main, capsys
+    set_vesting_token,
+    standard_vesting_parameters,
+    approvals,
+    funded_manager,
+    main,
+    eefi_contract,
+    dai_contract,
+    dai_whale,
+    verbose,
+    capsys,
 ):
     # ## Test Setup ##
 
@@ -3748,53 +2262,11 @@ def test_purchase_vesting_token_dai_fraction(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    dai_contract = Contract("0x6B175474E89094C44Da98b954EedeAC495271d0F")
-
     dai_token_address = dai_contract.address
 
-    dai_whale = accounts.at("0x748dE14197922c4Ae258c7939C7739f3ff1db573", force=True)
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Set Threshold and Release Percentage #
-
-    purchase_amount_threshold = 3000
-
-    vesting_executor.setPurchaseAmountThreshold(
-        purchase_amount_threshold, {"from": accounts[1]}
-    )  # Set threshold
-
-    release_percentage = 2 * 10**4
-
-    vesting_executor.setReleasePercentage(
-        release_percentage, {"from": accounts[1]}
-    )  # Set release percentage
-
     # Vesting Token Pricing #
 
-    vesting_token_price = 12
-
-    dai_approval = 500000 * 10**18
-
-    desired_eefi_amount = 330.50
-
-    purchase_amount = (desired_eefi_amount * vesting_token_price) * 10**18
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
+    desired_eefi_amount = 33050 * 10**16  # 330.50 EEFI
 
     # Set up Vesting Parameters #
 
@@ -3806,37 +2278,37 @@ def test_purchase_vesting_token_dai_fraction(
 
     ## Test Actions ##
 
-    dai_approval_tx = dai_contract.approve(
-        vesting_executor_address, dai_approval, {"from": dai_whale}
-    )
-
     purchase_tx = vesting_executor.purchaseVestingToken(
-        desired_eefi_amount * 10**18,
+        desired_eefi_amount,
         dai_token_address,
         eefi_contract.address,
         vesting_params_list,
         {"from": dai_whale},
     )
 
-    release_percentage_decimal = 0.02
-
-    bonus_amount = float(desired_eefi_amount * release_percentage_decimal)
+    bonus_amount = desired_eefi_amount * 2 // 100  # 2% released immediately
 
-    eefi_vested = (desired_eefi_amount - bonus_amount) * 10**18
+    eefi_vested = desired_eefi_amount - bonus_amount
 
-    vested_amount_contract = purchase_tx.events[-1]["vestedAssetAmount"]
+    vested_amount_contract = purchase_tx.events["vestingPurchaseTransactionComplete"]["vestedAssetAmount"]
 
-    assert math.isclose(
-        vested_amount_contract, eefi_vested, rel_tol=0.005
-    ), f"The amount vested ({vested_amount_contract}) and the expected amount ({eefi_vested}) are not as close as expected."
+    assert vested_amount_contract == eefi_vested, "Vested amount mismatch"
 
     with capsys.disabled():
-        print(purchase_tx.info())
+        verbose(purchase_tx.info)
 
 
 # Purchase price is fraction; amount desired is fraction;
 def test_purchase_vesting_token_dai_price_fraction(
-    standard_vesting_parameters, vesting_manager, main, capsys
+    standard_vesting_parameters,
+    approvals,
+    funded_manager,
+    main,
+    eefi_contract,
+    dai_contract,
+    dai_whale,
+    verbose,
+    capsys,
 ):
     # ## Test Setup ##
 
@@ -3844,35 +2316,11 @@ def test_purchase_vesting_token_dai_price_fraction(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    dai_contract = Contract("0x6B175474E89094C44Da98b954EedeAC495271d0F")
-
     dai_token_address = dai_contract.address
 
-    dai_whale = accounts.at("0x748dE14197922c4Ae258c7939C7739f3ff1db573", force=True)
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Set Threshold and Release Percentage #
-
-    purchase_amount_threshold = 3000
-
-    vesting_executor.setPurchaseAmountThreshold(
-        purchase_amount_threshold, {"from": accounts[1]}
-    )  # Set threshold
-
-    release_percentage = 2 * 10**4
-
-    vesting_executor.setReleasePercentage(
-        release_percentage, {"from": accounts[1]}
-    )  # Set release percentage
-
     # Vesting Token Pricing #
 
-    vesting_token_price = 12.25 * 10**4
+    vesting_token_price = 1225 * 10**2  # 12.25, scaled to 10^4
 
     eefi_token_address = eefi_contract.address
 
@@ -3887,25 +2335,9 @@ def test_purchase_vesting_token_dai_price_fraction(
         eefi_token_decimal_number,
     )
 
-    dai_approval = 500000 * 10**18
-
-    desired_eefi_amount = 400.7689878
-
-    purchase_amount = desired_eefi_amount * vesting_token_price
+    desired_eefi_amount = 4007689878 * 10**11  # 400.7689878 EEFI
 
-    purchase_amount_non_scaled = (desired_eefi_amount * vesting_token_price) / 10**4
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
+    purchase_amount = desired_eefi_amount * vesting_token_price // 10**4
 
     # Set up Vesting Parameters #
 
@@ -3917,38 +2349,27 @@ def test_purchase_vesting_token_dai_price_fraction(
 
     ## Test Actions ##
 
-    dai_approval_tx = dai_contract.approve(
-        vesting_executor_address, dai_approval, {"from": dai_whale}
-    )
-
     purchase_tx = vesting_executor.purchaseVestingToken(
-        desired_eefi_amount * 10**18,
+        desired_eefi_amount,
         dai_token_address,
         eefi_contract.address,
         vesting_params_list,
         {"from": dai_whale},
     )
-    release_percentage_decimal = 0.02
-
-    bonus_amount = int(desired_eefi_amount * release_percentage_decimal)
 
-    eefi_vested = (desired_eefi_amount - bonus_amount) * 10**18
-
-    payment_amount_contract = float(purchase_tx.events[0]["number"]) / 10**18
+    payment_amount_contract = purchase_tx.events["processLog"][0]["number"]
 
-    assert math.isclose(
-        payment_amount_contract, purchase_amount_non_scaled, rel_tol=1e-9
-    ), f"The payment amount in the contract ({payment_amount_contract}) and the purchase amount ({purchase_amount}) are not as close as expected."
+    assert payment_amount_contract == purchase_amount, "Payment amount mismatch"
 
     with capsys.disabled():
-        print(purchase_tx.info())
-        print("DAI whale balance", dai_contract.balanceOf(dai_whale))
-        print("Purchase Amount", purchase_amount_non_scaled)
+        verbose(purchase_tx.info)
+        verbose(lambda: print("DAI whale balance", dai_contract.balanceOf(dai_whale)))
+        print("Purchase Amount", purchase_amount / 10**18)
 
 
 # Test to ensure vesting still happens if small amounts of token are unlocked
 def test_standard_vesting_minor_difference(
-    standard_vesting_parameters, vesting_manager, main, capsys
+    standard_vesting_parameters, funded_manager, main, eefi_contract, verbose, capsys
 ):
     # ## Test Setup ##
 
@@ -3956,24 +2377,6 @@ def test_standard_vesting_minor_difference(
 
     vesting_executor = main
 
-    eefi_contract = Contract("0x92915c346287DdFbcEc8f86c8EB52280eD05b3A3")
-
-    vesting_executor_address = vesting_executor.address
-
-    vesting_manager_address = vesting_manager
-
-    # Transfer EEFI #
-
-    eefi_whale = accounts.at("0xf950a86013bAA227009771181a885E369e158da3", force=True)
-
-    transfer_amount = 5000 * 10**18
-
-    eefi_contract.transfer(
-        vesting_manager_address, transfer_amount, {"from": eefi_whale}
-    )
-
-    contract_eefi_balance = eefi_contract.balanceOf(vesting_manager_address)
-
     # Set up Vesting Parameters #
 
     vesting_params_list = standard_vesting_parameters
@@ -4010,8 +2413,8 @@ def test_standard_vesting_minor_difference(
     ), "Second transaction did not succeed"
 
     with capsys.disabled():
-        print(standard_vesting_transaction.info())
-        print(standard_vesting_transaction_1.info())
+        verbose(standard_vesting_transaction.info)
+        verbose(standard_vesting_transaction_1.info)
         print(
             "Transaction should succeed because total vested amount requests leave dust in the contract"
         )